@@ -72,6 +72,9 @@ class BranchMixin:
     @abstractmethod
     def get_section(self, name: str) -> Any: ...
 
+    @abstractmethod
+    def get_all_sections(self) -> list[Any]: ...
+
     @property
     @abstractmethod
     def backups(self) -> Any: ...
@@ -164,8 +167,7 @@ class BranchMixin:
                 # Auto-backup before potentially destructive deployment
                 try:
                     paths_to_backup = []
-                    for section_name in self.get_sections():
-                        section = self.get_section(section_name)
+                    for section in self.get_all_sections():
                         paths_to_backup.extend([p for p in section.paths if p.exists()])
 
                     if paths_to_backup:
@@ -177,7 +179,7 @@ class BranchMixin:
 
                 # Two-Phase Deployment for Target Branch
                 try:
-                    sections = [self.get_section(name) for name in self.get_sections()]
+                    sections = self.get_all_sections()
 
                     plan = self.scan_deployable_changes(sections)
 
@@ -318,8 +320,8 @@ class BranchMixin:
                     # Try to resolve the hook alias first
                     from .constants import HOOK_ALIASES
 
-                    if hook_name in HOOK_ALIASES:
-                        resolved_cmd: str = HOOK_ALIASES[hook_name]
+                    resolved_cmd = HOOK_ALIASES.get(hook_name)
+                    if resolved_cmd is not None:
                         hooks_to_run.add(resolved_cmd)
                     else:
                         # Fallback to get_hook_for_config
@@ -5,7 +5,7 @@ from pathlib import Path
 import click
 
 from .. import ui
-from ..config import DotManConfig, GlobalConfig
+from ..config import DotManConfig
 from ..constants import REPO_DIR
 from ..exceptions import DotManError
 from ..files import copy_directory, copy_file
@@ -94,11 +94,10 @@ def add(
 
         repo_base = repo_base or section
 
-        # Load config
-        global_config = GlobalConfig()
-        global_config.load()
+        from ..operations import get_operations
 
-        dotman_config = DotManConfig(global_config=global_config)
+        # Load config, reusing the process-wide global config
+        dotman_config = DotManConfig(global_config=get_operations().global_config)
         try:
             dotman_config.load()
         except (FileNotFoundError, DotManError):
@@ -4,7 +4,6 @@ import click
 from rich.table import Table
 
 from .. import ui
-from ..config import GlobalConfig
 from ..core import GitManager
 from ..exceptions import DotManError
 from .common import complete_branches, error, handle_exception, require_init, success
@@ -22,9 +21,11 @@ def branch():
 def branch_list():
     """List all configuration branches."""
     try:
+        from ..operations import get_operations
+
         git = GitManager()
-        global_config = GlobalConfig()
-        global_config.load()
+        # Shared, already-loaded config: no extra parse when dispatched in-process
+        global_config = get_operations().global_config
 
         current = global_config.current_branch
         branches = git.list_branches()
@@ -57,9 +58,11 @@ def branch_list():
 def branch_delete(name: str, force: bool):
     """Delete a configuration branch."""
     try:
+        from ..operations import get_operations
+
         git = GitManager()
-        global_config = GlobalConfig()
-        global_config.load()
+        # Shared, already-loaded config: no extra parse when dispatched in-process
+        global_config = get_operations().global_config
 
         if name == global_config.current_branch:
             branches = git.list_branches()
@@ -162,7 +162,8 @@ def require_init(func):
             ui.console.print()
             raise SystemExit(1)
 
-        if not REPO_DIR.exists() or not (REPO_DIR / ".git").exists():
+        # REPO_DIR/.git existing implies REPO_DIR exists: one stat, not two
+        if not (REPO_DIR / ".git").exists():
             error("Repository not initialized. Run 'dot-man init' first.", exit_code=1)
 
         return func(*args, **kwargs)
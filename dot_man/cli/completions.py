@@ -2,7 +2,6 @@
 
 import json
 import logging
-import os
 import subprocess
 import time
 
@@ -56,12 +55,15 @@ def _get_completion_cache() -> dict:
             _memory_cache = {}
             _memory_cache_time = time.time()
             return _memory_cache
-        if COMPLETION_CACHE_FILE.exists():
-            mtime = os.path.getmtime(COMPLETION_CACHE_FILE)
-            if time.time() - mtime < COMPLETION_CACHE_TTL:
-                _memory_cache = json.loads(COMPLETION_CACHE_FILE.read_text())
-                _memory_cache_time = time.time()
-                return _memory_cache
+        # One stat answers both "exists?" and "fresh?"; the bytes go straight
+        # to the JSON parser, which detects UTF-8 itself
+        mtime = COMPLETION_CACHE_FILE.stat().st_mtime
+        if time.time() - mtime < COMPLETION_CACHE_TTL:
+            _memory_cache = json.loads(COMPLETION_CACHE_FILE.read_bytes())
+            _memory_cache_time = time.time()
+            return _memory_cache
+    except FileNotFoundError:
+        pass
     except Exception:
         logging.debug("Failed to load completion cache from file")
 
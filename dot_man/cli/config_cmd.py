@@ -1,6 +1,7 @@
 """Config command for dot-man CLI."""
 
 import json
+from typing import Any, Iterator
 
 import click
 from rich.table import Table
@@ -11,6 +12,19 @@ from ..exceptions import ConfigurationError
 from .common import complete_config_keys, error, require_init, success
 from .interface import cli as main
 
+# Case-insensitive boolean spellings accepted by `config set`
+_BOOL_LITERALS = {"true": True, "false": False}
+
+
+def _flatten(data: dict, parent_key: str = "") -> Iterator[tuple[str, Any]]:
+    """Yield (dotted.key, value) for every non-table value in data."""
+    for k, v in data.items():
+        key = f"{parent_key}.{k}" if parent_key else k
+        if isinstance(v, dict):
+            yield from _flatten(v, key)
+        else:
+            yield key, v
+
 
 @main.group("config")
 def config():
@@ -87,23 +101,11 @@ def config_list():
         cfg = GlobalConfig()
         cfg.load()
 
-        def flatten(d, parent_key="", sep="."):
-            items = []
-            for k, v in d.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                if isinstance(v, dict):
-                    items.extend(flatten(v, new_key, sep=sep).items())
-                else:
-                    items.append((new_key, v))
-            return dict(items)
-
-        flat_data = flatten(cfg._data)
-
         table = Table(title="Global Configuration")
         table.add_column("Key", style="cyan")
         table.add_column("Value")
 
-        for k, v in sorted(flat_data.items()):
+        for k, v in sorted(_flatten(cfg._data), key=lambda kv: kv[0]):
             table.add_row(k, str(v))
 
         ui.console.print(table)
@@ -159,13 +161,7 @@ def config_set(key: str, value: str):
         except (FileNotFoundError, ConfigurationError):
             cfg.create_default()
 
-        val: bool | str
-        if value.lower() == "true":
-            val = True
-        elif value.lower() == "false":
-            val = False
-        else:
-            val = value
+        val: bool | str = _BOOL_LITERALS.get(value.lower(), value)
 
         parts = key.split(".")
         current = cfg._data
@@ -224,8 +220,7 @@ def config_create(with_examples: bool, minimal: bool, force: bool):
         dotman_config = DotManConfig()
 
         if minimal:
-            dotman_config._data = {}
-            dotman_config.save()
+            dotman_config.create_default(with_examples=False)
             ui.console.print(f"Created minimal config at {config_path}")
         else:
             dotman_config.create_default()
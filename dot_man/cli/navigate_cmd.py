@@ -9,10 +9,11 @@ from pathlib import Path
 import click
 
 from .. import ui
-from ..constants import REPO_DIR
+from ..constants import LOCK_FILE, REPO_DIR
 from ..core import GitManager
 from ..files import compare_files
 from ..hooks import run_checkout_hooks, run_switch_hooks
+from ..lock import FileLock
 from .common import (
     BRANCH,
     AliasedCommand,
@@ -565,35 +566,39 @@ def _handle_branch_navigate(
         saved_count = save_result["saved"]
         secrets = save_result["secrets"]
         errors = save_result["errors"]
-        sections = get_changed_sections(ops)
-
-        if secrets:
-            warn(f"{len(secrets)} secrets were redacted during save")
-
-        if errors:
-            ui.error(f"Encountered {len(errors)} errors during save:")
-            for err in errors:
-                ui.console.print(f"  [red]• {err}[/red]")
 
-        if commit_message and commit_message.lower() != "none":
-            if commit_message.lower() == "auto":
-                commit_msg = generate_commit_message(
-                    current_branch, target_branch, "branch", saved_count, sections
-                )
-            else:
-                commit_msg = commit_message
-
-            commit_sha = ops.git.commit(commit_msg)
-            if commit_sha:
-                ui.console.print(f"  Committed: [dim]{commit_sha[:7]}[/dim]")
-                if commit_message.lower() != "auto":
-                    ui.console.print(f"  [dim]Commit: {commit_msg}[/dim]")
+        if not (saved_count or errors or ops.git.is_dirty()):
+            ui.console.print("  No changes to save")
         else:
-            commit_sha = None
+            sections = get_changed_sections(ops)
+
+            if secrets:
+                warn(f"{len(secrets)} secrets were redacted during save")
+
+            if errors:
+                ui.error(f"Encountered {len(errors)} errors during save:")
+                for err in errors:
+                    ui.console.print(f"  [red]• {err}[/red]")
+
+            if commit_message and commit_message.lower() != "none":
+                if commit_message.lower() == "auto":
+                    commit_msg = generate_commit_message(
+                        current_branch, target_branch, "branch", saved_count, sections
+                    )
+                else:
+                    commit_msg = commit_message
+
+                commit_sha = ops.git.commit(commit_msg)
+                if commit_sha:
+                    ui.console.print(f"  Committed: [dim]{commit_sha[:7]}[/dim]")
+                    if commit_message.lower() != "auto":
+                        ui.console.print(f"  [dim]Commit: {commit_msg}[/dim]")
+            else:
+                commit_sha = None
 
-        ui.console.print(f"  Saved {saved_count} files")
-        if not commit_sha and saved_count > 0:
-            ui.console.print("  [dim](no commit created)[/dim]")
+            ui.console.print(f"  Saved {saved_count} files")
+            if not commit_sha and saved_count > 0:
+                ui.console.print("  [dim](no commit created)[/dim]")
     else:
         ui.console.print("  [dim]Discarded uncommitted changes[/dim]")
 
@@ -627,30 +632,17 @@ def _handle_branch_navigate(
         f"[bold]Phase 3:[/bold] Deploying '{target_branch}' configuration..."
     )
 
-    deployed_count = 0
-    pre_hooks = []
-    post_hooks = []
-
-    for section_name in ops.get_sections():
-        section = ops.get_section(section_name)
-        for local_path in section.paths:
-            repo_path = section.get_repo_path(local_path, REPO_DIR)
-            if repo_path.exists():
-                will_change = not local_path.exists() or not compare_files(
-                    repo_path, local_path
-                )
-                if will_change:
-                    if section.pre_deploy:
-                        pre_hooks.append(section.pre_deploy)
-                    if section.post_deploy:
-                        post_hooks.append(section.post_deploy)
-
-    pre_hooks = list(dict.fromkeys(pre_hooks))
-    post_hooks = list(dict.fromkeys(post_hooks))
+    # Scan once: the same plan (one repo path + comparison per tracked path)
+    # drives both hook selection and the deployment itself. The lock is held
+    # from the scan through the deploy, so the plan cannot go stale.
+    with FileLock(LOCK_FILE):
+        plan = ops.scan_deployable_changes(ops.get_all_sections())
+        pre_hooks = list(dict.fromkeys(plan["pre_hooks"]))
+        post_hooks = list(dict.fromkeys(plan["post_hooks"]))
 
-    _run_shell_hooks(pre_hooks, "Running pre-deploy hooks")
+        _run_shell_hooks(pre_hooks, "Running pre-deploy hooks")
 
-    deploy_result = ops.deploy_all()
+        deploy_result = ops.execute_deployment_plan(plan)
     deployed_count = deploy_result["deployed"]
     errors = [e for e in deploy_result["errors"] if e and str(e).strip()]
 
@@ -5,13 +5,26 @@ from types import ModuleType
 import click
 
 from .. import ui
-from ..config import GlobalConfig
 from ..core import GitManager
 from ..exceptions import DotManError
 from .common import AliasedCommand, error, require_init, success, warn
 from .interface import cli as main
 
 
+def _shared_global_config():
+    """Return the already-loaded global config of the shared operations instance."""
+    from ..operations import get_operations
+
+    return get_operations().global_config
+
+
+def _save_remote_url(url: str) -> None:
+    """Persist the remote URL with a single save of the shared global config."""
+    global_config = _shared_global_config()
+    global_config.remote_url = url
+    global_config.save()
+
+
 @main.group("remote")
 def remote():
     """Manage remote repository connection."""
@@ -30,10 +43,7 @@ def remote_set(url: str):
         git = GitManager()
         git.set_remote(url)
 
-        global_config = GlobalConfig()
-        global_config.load()
-        global_config.remote_url = url
-        global_config.save()
+        _save_remote_url(url)
 
         success(f"Remote set to: {url}")
     except DotManError as e:
@@ -118,8 +128,7 @@ def sync_branch():
                 git.repo.git.branch("-m", local_current, remote_default)
 
                 # Update global config
-                global_config = GlobalConfig()
-                global_config.load()
+                global_config = _shared_global_config()
                 global_config.current_branch = remote_default
                 global_config.save()
 
@@ -301,10 +310,7 @@ def _setup_gh_created_success(git: GitManager, repo_name: str) -> bool:
     """Handle successful repo creation. Returns True."""
     remote_url = git.get_remote_url()
     if remote_url:
-        global_config = GlobalConfig()
-        global_config.load()
-        global_config.remote_url = remote_url
-        global_config.save()
+        _save_remote_url(remote_url)
 
     success(f"Created and connected to GitHub repository: {repo_name}")
     ui.console.print()
@@ -383,10 +389,7 @@ def _setup_gh_connect_existing(
 def _setup_connect_to_url(git: GitManager, url: str) -> None:
     """Set remote and save to global config."""
     git.set_remote(url)
-    global_config = GlobalConfig()
-    global_config.load()
-    global_config.remote_url = url
-    global_config.save()
+    _save_remote_url(url)
     success(f"Connected to existing repository: {url}")
 
 
@@ -452,10 +455,7 @@ def _setup_run_manual_flow(git: GitManager) -> None:
     try:
         git.set_remote(url)
 
-        global_config = GlobalConfig()
-        global_config.load()
-        global_config.remote_url = url
-        global_config.save()
+        _save_remote_url(url)
 
         success(f"Remote set to: {url}")
 
@@ -1,12 +1,11 @@
 """Status command for dot-man CLI."""
 
 import json
+import os
 from itertools import groupby
 from pathlib import Path
 
 import click
-from rich.panel import Panel
-from rich.table import Table
 
 from .. import ui
 from ..constants import REPO_DIR
@@ -28,15 +27,23 @@ def status(verbose: bool, secrets: bool, json_output: bool):
 
     Shows the current branch, tracked files, and any pending changes
     that would be saved on the next switch.
+
+    The report is assembled into a single renderable group and printed
+    once, so large outputs cost one terminal write instead of one per line.
     """
     try:
+        from rich.console import Group, RenderableType
+        from rich.panel import Panel
+        from rich.table import Table
+
         from ..operations import get_operations
 
         ops = get_operations()
 
         # Repository info panel
         branch = ops.current_branch
-        remote = ops.global_config.remote_url or "[dim]Not configured[/dim]"
+        remote_url = ops.global_config.remote_url
+        remote = remote_url or "[dim]Not configured[/dim]"
 
         info_table = Table(show_header=False, box=None, padding=(0, 2))
         info_table.add_column(style="cyan")
@@ -45,40 +52,29 @@ def status(verbose: bool, secrets: bool, json_output: bool):
         info_table.add_row("Remote:", remote)
         info_table.add_row("Repository:", str(REPO_DIR))
 
-        ui.console.print(
+        renderables: list[RenderableType] = [
             Panel(
                 info_table, title="[bold]Repository Status[/bold]", border_style="blue"
-            )
-        )
-        ui.console.print()
+            ),
+            "",
+        ]
 
-        # Get detailed status once (Optimized single pass)
-        status_items = list(ops.get_detailed_status())
+        # Get detailed status once; it is consumed by a single pass below
+        status_items = ops.get_detailed_status()
 
-        # Calculate summary from items
+        # Summary is tallied while the items are rendered below
         summary = {"modified": 0, "new": 0, "deleted": 0, "identical": 0}
-
-        section_names_set = set()
-        for item in status_items:
-            section_names_set.add(item["section"])
-            st = item["status"]
-            if st == "MODIFIED":
-                summary["modified"] += 1
-            elif st == "NEW":
-                summary["new"] += 1
-            elif st == "DELETED":
-                summary["deleted"] += 1
-            else:
-                summary["identical"] += 1
+        summary_keys = {"MODIFIED": "modified", "NEW": "new", "DELETED": "deleted"}
 
         all_section_names = ops.get_sections()
         if not all_section_names:
             if json_output:
                 click.echo(json.dumps({"sections": [], "summary": summary}))
             else:
-                ui.console.print(
+                renderables.append(
                     "[dim]No sections tracked. Run 'dot-man add <path>' to add files.[/dim]"
                 )
+                ui.console.print(Group(*renderables))
             return
 
         # JSON output mode
@@ -86,7 +82,7 @@ def status(verbose: bool, secrets: bool, json_output: bool):
             sections_list: list[dict] = []
             output = {
                 "branch": branch,
-                "remote": ops.global_config.remote_url or "",
+                "remote": remote_url or "",
                 "repository": str(REPO_DIR),
                 "sections": sections_list,
                 "summary": summary,
@@ -95,12 +91,12 @@ def status(verbose: bool, secrets: bool, json_output: bool):
             for section_name, group in groupby(
                 status_items, key=lambda x: x["section"]
             ):
-                items = list(group)
                 section_data = {
                     "name": section_name,
                     "files": [],
                 }
-                for item in items:
+                for item in group:
+                    summary[summary_keys.get(item["status"], "identical")] += 1
                     section_data["files"].append(
                         {
                             "path": str(item["local_path"]),
@@ -127,19 +123,28 @@ def status(verbose: bool, secrets: bool, json_output: bool):
         scanner = get_custom_scanner() if secrets else None
         secrets_found = []
 
+        # Resolve the home prefix once for path shortening below
+        home = str(Path.home())
+        home_prefix = home + os.sep
+        home_len = len(home)
+
         # Items are already sorted by section iteration order from get_detailed_status
         displayed_sections = 0
 
         for section_name, group in groupby(status_items, key=lambda x: x["section"]):
             if displayed_sections >= 10:
-                file_table.add_row(
-                    f"[dim]... +{len(all_section_names) - 10} more sections[/dim]",
-                    "",
-                    "",
-                )
-                break
+                # Past the display limit: only tally the remaining items
+                if displayed_sections == 10:
+                    file_table.add_row(
+                        f"[dim]... +{len(all_section_names) - 10} more sections[/dim]",
+                        "",
+                        "",
+                    )
+                    displayed_sections += 1
+                for item in group:
+                    summary[summary_keys.get(item["status"], "identical")] += 1
+                continue
 
-            items = list(group)
             # Retrieve section object for metadata like 'inherits'
             # Note: This is a fast lookup
             section = ops.get_section(section_name)
@@ -153,13 +158,17 @@ def status(verbose: bool, secrets: bool, json_output: bool):
 
             # Files under section
             path_count = 0
-            for item in items:
+            for item in group:
+                file_status = item["status"]
+                summary[summary_keys.get(file_status, "identical")] += 1
+
                 if path_count >= 5:  # Limit per section
-                    file_table.add_row("  [dim]... more files[/dim]", "", "")
-                    break
+                    if path_count == 5:
+                        file_table.add_row("  [dim]... more files[/dim]", "", "")
+                        path_count += 1
+                    continue
 
                 local_path = item["local_path"]
-                file_status = item["status"]
 
                 color = status_colors.get(file_status, "white")
 
@@ -167,7 +176,9 @@ def status(verbose: bool, secrets: bool, json_output: bool):
                 icon = "📁" if local_path.is_dir() else "📄"
 
                 # Shorten path
-                display_path = str(local_path).replace(str(Path.home()), "~")
+                display_path = str(local_path)
+                if display_path == home or display_path.startswith(home_prefix):
+                    display_path = "~" + display_path[home_len:]
                 if len(display_path) > 35:
                     display_path = "..." + display_path[-32:]
 
@@ -192,27 +203,30 @@ def status(verbose: bool, secrets: bool, json_output: bool):
 
             displayed_sections += 1
 
-        ui.console.print(file_table)
+        renderables.append(file_table)
 
         # Summary
-        ui.console.print()
-        ui.console.print(
+        renderables.append("")
+        renderables.append(
             f"[dim]Summary: {summary['modified']} modified, {summary['new']} new, {summary['deleted']} deleted, {summary['identical']} identical[/dim]"
         )
 
         # Secrets warning
         if secrets_found:
-            ui.console.print()
-            from .common import warn
+            renderables.append("")
+            renderables.append(
+                f"[warning]⚠[/warning] {len(secrets_found)} potential secrets detected. Run 'dot-man audit' for details."
+            )
 
-            warn(
-                f"{len(secrets_found)} potential secrets detected. Run 'dot-man audit' for details."
+        # Git status (one porcelain call yields both the dirty bit and the count)
+        uncommitted = ops.git.status_porcelain()
+        if uncommitted:
+            renderables.append("")
+            renderables.append(
+                f"[yellow]Repository has {len(uncommitted)} uncommitted changes.[/yellow]"
             )
 
-        # Git status
-        if ops.git.is_dirty():
-            ui.console.print()
-            ui.console.print("[yellow]Repository has uncommitted changes.[/yellow]")
+        ui.console.print(Group(*renderables))
 
     except DotManError as e:
         error(str(e), e.exit_code)
@@ -1,30 +1,14 @@
 """Template variables command for dot-man CLI."""
 
 import os
-import platform
-import socket
-from pathlib import Path
 
 import click
 
 from .. import ui
+from ..global_config import SYSTEM_VARS
 from .common import complete_template_keys, error, success, warn
 from .interface import cli as main
 
-# System variables that can be auto-detected
-SYSTEM_VARS = {
-    "HOSTNAME": lambda: socket.gethostname(),
-    "USER": lambda: os.environ.get("USER", os.environ.get("USERNAME", "unknown")),
-    "HOME": lambda: str(Path.home()),
-    "OS": lambda: platform.system(),
-    "OS_VERSION": lambda: platform.version(),
-    "ARCH": lambda: platform.machine(),
-    "SHELL": lambda: os.environ.get("SHELL", "/bin/sh"),
-    "EDITOR": lambda: os.environ.get("EDITOR", os.environ.get("VISUAL", "vim")),
-    "EMAIL": lambda: None,  # Requires git config
-    "DOMAIN": lambda: socket.getfqdn(),
-}
-
 
 @main.group("template")
 def template():
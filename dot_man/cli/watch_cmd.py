@@ -197,7 +197,7 @@ def watch(interval: float, commit: bool, message: str, dry_run: bool):
         from ..operations import get_operations
 
         ops = get_operations()
-        sections = [ops.get_section(n) for n in ops.get_sections()]
+        sections = ops.get_all_sections()
 
         if not sections:
             warn("No sections configured. Run 'dot-man add <path>' first.")
@@ -28,6 +28,9 @@ DOT_MAN_YML = "dot-man.yml"
 # Priority order for config files (first match wins)
 CONFIG_FILE_PRIORITY = [DOT_MAN_TOML, DOT_MAN_YAML, DOT_MAN_YML]
 
+# Candidate config paths for the default repository, joined once at import
+DEFAULT_CONFIG_PATHS = tuple(REPO_DIR / name for name in CONFIG_FILE_PRIORITY)
+
 # Template variables storage
 TEMPLATE_VARS_FILE = DOT_MAN_DIR / "template_vars.json"
 
@@ -76,7 +79,8 @@ DEFAULT_IGNORED_DIRECTORIES = [
 
 # Hook aliases - canonical source of all known reload hooks.
 # Placeholders ({section_name}, {config_name}, {config_root}, {paths}, {branch})
-# are resolved at runtime by Section._resolve_hook().
+# are resolved by Section._resolve_hook() when a section is built, so each
+# resolved section already carries its final command.
 HOOK_ALIASES = {
     # Shells
     "shell_reload": "source ~/.bashrc 2>/dev/null || source ~/.zshrc 2>/dev/null || true",
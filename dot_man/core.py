@@ -1,14 +1,16 @@
 """Git operations wrapper for dot-man."""
 
+import functools
+import io
 import logging
+import os
+import time
 
 __all__ = ["GitManager"]
 
 from pathlib import Path
-from typing import Iterator
-
-from git import GitCommandError, Repo
-from git.exc import InvalidGitRepositoryError
+from subprocess import PIPE, CompletedProcess, Popen, run
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar, cast
 
 from .constants import GIT_IGNORE_PATTERNS, REPO_DIR
 from .exceptions import (
@@ -17,36 +19,204 @@ from .exceptions import (
     NotInitializedError,
 )
 
+_T = TypeVar("_T")
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    # GitPython takes tens of milliseconds to import, so it is only loaded
+    # once a method actually needs a Repo
+    from git import Repo
+
+# Bytes requested per read when streaming git output
+_STREAM_CHUNK_SIZE = 8192
+
+# Applied to every git process: git's messages stay in English so the
+# stderr checks below match under any locale, and optional index locks
+# are never taken
+_GIT_ENV_OVERRIDES = {"LC_ALL": "C", "GIT_OPTIONAL_LOCKS": "0"}
+
+# Message recorded on stash commits made around a pull
+_AUTO_STASH_MESSAGE = "dot-man-auto-stash"
+
+
+@functools.cache
+def _fetch_pool() -> "ThreadPoolExecutor":
+    """Process-wide executor for background fetches.
+
+    Shared by every GitManager so polling callers reuse its threads
+    instead of creating an executor per sync check.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="dotman-fetch")
+
+
+def _mutates(method):
+    """Invalidate GitManager's query cache around a repository change.
+
+    The epoch is bumped before and after, so results cached while the
+    method runs (e.g. its own branch_exists check) are not reused later.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._invalidate()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate()
+
+    return wrapper
+
 
 class GitManager:
     """Wrapper for git operations on the dot-man repository."""
 
+    # Seconds between network fetches unless forced
+    FETCH_MIN_INTERVAL = 30.0
+    # Seconds a computed sync status is reused for polling callers
+    SYNC_STATUS_TTL = 5.0
+
     def __init__(self, repo_path: Path | None = None):
         self._repo_path = repo_path or REPO_DIR
-        self._repo: Repo | None = None
+        self._repo: "Repo | None" = None
+        # Read-only query results, valid while their epoch matches _epoch;
+        # every mutating method bumps the epoch
+        self._cache: dict[str, tuple[int, Any]] = {}
+        self._epoch = 0
+        self._env: dict[str, str] | None = None
+        self._last_fetch = 0.0
+        # (epoch, monotonic time, status) of the last successful sync check
+        self._sync_status: tuple[int, float, dict] | None = None
 
     @property
-    def repo(self) -> Repo:
+    def repo(self) -> "Repo":
         """Get the git repository object."""
         if self._repo is None:
+            from git import Repo
+            from git.exc import InvalidGitRepositoryError
+
             try:
                 self._repo = Repo(self._repo_path)
             except InvalidGitRepositoryError:
                 raise NotInitializedError(f"Not a git repository: {self._repo_path}")
+            self._repo.git.update_environment(**_GIT_ENV_OVERRIDES)
         return self._repo
 
+    def _cached(self, key: str, compute: Callable[[], _T]) -> _T:
+        """Return compute(), reusing the result until the next mutation."""
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == self._epoch:
+            return cast(_T, entry[1])
+        value = compute()
+        self._cache[key] = (self._epoch, value)
+        return value
+
+    def _invalidate(self) -> None:
+        """Drop cached query results after changing the repository."""
+        self._epoch += 1
+
+    def _git(self, *args: str) -> CompletedProcess[str]:
+        """Run a git command in the repository without going through GitPython.
+
+        Read-only queries parse porcelain output from a single git process
+        instead of building GitPython objects. Discovery is confined to the
+        repository path so a parent repository is never picked up.
+
+        Raises:
+            NotInitializedError: If the path is not a git repository
+            GitOperationError: If git cannot be executed
+        """
+        try:
+            result = run(
+                ["git", "-C", str(self._repo_path), *args],
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                env=self._git_env(),
+            )
+        except OSError as e:
+            raise GitOperationError(f"Failed to run git: {e}")
+        self._check_repository(result.returncode, result.stderr)
+        return result
+
+    def _git_stream(self, *args: str) -> Iterator[bytes]:
+        """Run a git command and yield its NUL-terminated output records.
+
+        Records are yielded as they arrive on the pipe, so a caller that
+        stops early never waits for (or buffers) the rest of the output.
+
+        Raises:
+            NotInitializedError: If the path is not a git repository
+            GitOperationError: If git cannot be executed
+        """
+        try:
+            proc = Popen(
+                ["git", "-C", str(self._repo_path), *args],
+                stdout=PIPE,
+                stderr=PIPE,
+                env=self._git_env(),
+            )
+        except OSError as e:
+            raise GitOperationError(f"Failed to run git: {e}")
+
+        assert proc.stdout is not None and proc.stderr is not None
+        # Popen's binary pipes are BufferedReaders; read1 returns what
+        # has arrived instead of waiting for a full chunk
+        stdout = cast(io.BufferedReader, proc.stdout)
+        try:
+            pending = b""
+            while chunk := stdout.read1(_STREAM_CHUNK_SIZE):
+                *records, pending = (pending + chunk).split(b"\0")
+                yield from records
+            if pending:
+                yield pending
+            stderr = proc.stderr.read().decode("utf-8", "replace")
+            self._check_repository(proc.wait(), stderr)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def _git_env(self) -> dict[str, str]:
+        """Environment for git subprocesses, confined to the repository path.
+
+        Built once per manager rather than copying ``os.environ`` per call.
+        """
+        if self._env is None:
+            self._env = dict(
+                os.environ,
+                GIT_CEILING_DIRECTORIES=str(self._repo_path.parent),
+                **_GIT_ENV_OVERRIDES,
+            )
+        return self._env
+
+    def _check_repository(self, returncode: int, stderr: str) -> None:
+        """Raise NotInitializedError if git reported a missing repository."""
+        if returncode == 128 and "not a git repository" in stderr:
+            raise NotInitializedError(f"Not a git repository: {self._repo_path}")
+
     def is_initialized(self) -> bool:
         """Check if the repository is initialized."""
+        # .git existing implies the repository directory does: one stat
         try:
-            return self._repo_path.exists() and (self._repo_path / ".git").exists()
-        except OSError:
+            os.stat(self._repo_path / ".git")
+        except (OSError, ValueError):
             return False
+        return True
 
+    @_mutates
     def init(self) -> None:
         """Initialize a new git repository."""
+        from git import GitCommandError, Repo
+
         try:
             self._repo_path.mkdir(parents=True, exist_ok=True)
             self._repo = Repo.init(self._repo_path)
+            self._repo.git.update_environment(**_GIT_ENV_OVERRIDES)
 
             # Create .gitignore
             gitignore_path = self._repo_path / ".gitignore"
@@ -58,21 +228,34 @@ class GitManager:
                     config.set_value("user", "name", "dot-man")
                 if not config.has_option("user", "email"):
                     config.set_value("user", "email", "dot-man@localhost")
+                # Let status skip rescanning unchanged untracked directories
+                config.set_value("core", "untrackedCache", "true")
 
         except (GitCommandError, OSError) as e:
             raise GitOperationError(f"Failed to initialize repository: {e}")
 
     def current_branch(self) -> str:
         """Get the current branch name."""
-        try:
-            return self.repo.active_branch.name
-        except TypeError:
+        return self._cached("current_branch", self._read_current_branch)
+
+    def _read_current_branch(self) -> str:
+        result = self._git("symbolic-ref", "--quiet", "--short", "HEAD")
+        if result.returncode != 0:
             # Detached HEAD state
             return "HEAD"
+        return result.stdout.strip()
 
     def list_branches(self) -> list[str]:
         """List all local branches."""
-        return [head.name for head in self.repo.heads]
+        return list(self._cached("branches", self._read_branches))
+
+    def _read_branches(self) -> tuple[str, ...]:
+        result = self._git(
+            "for-each-ref", "--format=%(refname:lstrip=2)", "refs/heads/"
+        )
+        if result.returncode != 0:
+            raise GitOperationError(f"Failed to list branches: {result.stderr}")
+        return tuple(result.stdout.splitlines())
 
     def list_tags(self) -> list[str]:
         """List all local tags."""
@@ -80,20 +263,37 @@ class GitManager:
 
     def branch_exists(self, name: str) -> bool:
         """Check if a branch exists."""
-        return name in self.list_branches()
+        branch_set = self._cached(
+            "branch_set",
+            lambda: frozenset(self._cached("branches", self._read_branches)),
+        )
+        return name in branch_set
 
+    @_mutates
     def create_branch(self, name: str) -> None:
         """Create a new branch."""
+        from git import GitCommandError
+
         try:
             self.repo.create_head(name)
         except (GitCommandError, OSError, ValueError) as e:
             raise GitOperationError(f"Failed to create branch '{name}': {e}")
 
+    @_mutates
     def checkout(self, branch: str, create: bool = False) -> None:
         """Checkout a branch, optionally creating it."""
+        from git import GitCommandError
+
         try:
-            if create and not self.branch_exists(branch):
-                self.create_branch(branch)
+            if create:
+                # One `git checkout -b` creates and switches; only an
+                # existing branch falls through to a plain checkout
+                try:
+                    self.repo.git.checkout("-b", branch)
+                    return
+                except GitCommandError as e:
+                    if "already exists" not in str(e.stderr):
+                        raise
 
             self.repo.heads[branch].checkout()
         except IndexError:
@@ -101,12 +301,15 @@ class GitManager:
         except (GitCommandError, OSError) as e:
             raise GitOperationError(f"Failed to checkout '{branch}': {e}")
 
+    @_mutates
     def checkout_commit(self, sha: str) -> None:
         """Checkout a specific commit (creates detached HEAD).
 
         Args:
             sha: Full or partial commit SHA
         """
+        from git import GitCommandError
+
         try:
             # Try to resolve the commit
             commit = self.repo.commit(sha)
@@ -141,6 +344,8 @@ class GitManager:
             ref: Commit reference (default: HEAD)
             message: Optional message for annotated tags
         """
+        from git import GitCommandError
+
         try:
             self.repo.create_tag(name, ref=ref, message=message)
         except (GitCommandError, OSError, ValueError) as e:
@@ -152,6 +357,8 @@ class GitManager:
         Args:
             name: Tag name to delete
         """
+        from git import GitCommandError
+
         try:
             # Check if tag exists
             if name not in self.list_tags():
@@ -166,7 +373,38 @@ class GitManager:
 
     def is_dirty(self) -> bool:
         """Check if the repository has uncommitted changes."""
-        return self.repo.is_dirty(untracked_files=True)
+        return bool(self.status_porcelain())
+
+    def status_porcelain(self, untracked: str = "normal") -> list[tuple[str, str]]:
+        """Get working tree changes from a single ``git status --porcelain`` call.
+
+        Covers staged, unstaged, and untracked files in one git process
+        (``Repo.is_dirty(untracked_files=True)`` spawns three).
+
+        Args:
+            untracked: Value for ``--untracked-files``; "all" lists files
+                inside untracked directories instead of the directory itself
+
+        Returns:
+            List of (XY status code, path) tuples, empty if the tree is clean
+        """
+        result = self._git(
+            "status", "--porcelain", "-z", f"--untracked-files={untracked}"
+        )
+        if result.returncode != 0:
+            raise GitOperationError(f"Failed to get status: {result.stderr}")
+        output = result.stdout
+        entries: list[tuple[str, str]] = []
+        records = iter(output.split("\0"))
+        for record in records:
+            if not record:
+                continue
+            code, path = record[:2], record[3:]
+            if code[0] in ("R", "C"):
+                # Renames and copies carry the original path as the next record
+                next(records, None)
+            entries.append((code, path))
+        return entries
 
     def get_status(self) -> dict[str, list[str]]:
         """Get the repository status.
@@ -181,60 +419,79 @@ class GitManager:
             "untracked": [],
         }
 
-        # Get diff from index
-        for diff in self.repo.index.diff(None):
-            if diff.a_path:
-                if diff.change_type == "M":
-                    status["modified"].append(diff.a_path)
-                elif diff.change_type == "D":
-                    status["deleted"].append(diff.a_path)
-                elif diff.change_type == "A":
-                    status["new"].append(diff.a_path)
-
-        # Get untracked files
-        status["untracked"] = self.repo.untracked_files
+        # Staged and unstaged changes plus untracked files in one git process
+        for code, path in self.status_porcelain(untracked="all"):
+            if code == "??":
+                status["untracked"].append(path)
+            elif "D" in code:
+                status["deleted"].append(path)
+            elif code[0] in ("A", "R", "C"):
+                status["new"].append(path)
+            else:
+                status["modified"].append(path)
 
         return status
 
     def add_all(self) -> None:
         """Stage all changes."""
+        from git import GitCommandError
+
         try:
             self.repo.git.add(A=True)
         except (GitCommandError, OSError) as e:
             raise GitOperationError(f"Failed to stage changes: {e}")
 
+    @_mutates
     def commit(self, message: str) -> str | None:
         """Create a commit with the given message.
 
         Returns:
             Commit SHA if commit was made, None if nothing to commit
         """
-        if not self.is_dirty():
-            return None
+        from git import GitCommandError
 
         try:
             self.add_all()
-            commit = self.repo.index.commit(message)
-            return commit.hexsha
+            # add -A has just refreshed the index, so comparing it with HEAD
+            # decides "anything to commit?" without another worktree scan
+            staged = self._git("diff", "--cached", "--quiet")
+            if staged.returncode == 0:
+                return None
+            if staged.returncode != 1:
+                raise GitOperationError(f"Failed to commit: {staged.stderr}")
+            # git writes the tree and commit natively; GitPython's
+            # index.commit would re-read the index and build them in Python.
+            # Left unsigned, as index.commit was.
+            self.repo.git.commit(
+                "--quiet", "--no-gpg-sign", "--allow-empty-message", "-m", message
+            )
+            return self.repo.head.commit.hexsha
         except (GitCommandError, OSError, ValueError) as e:
             raise GitOperationError(f"Failed to commit: {e}")
 
     def get_commits(self, count: int = 10) -> Iterator[dict]:
         """Get recent commits.
 
+        Commits are parsed straight from streamed ``git log`` output; a
+        repository without commits yields nothing.
+
         Yields:
             Dictionary with: sha, message, author, date
         """
-        try:
-            for commit in self.repo.iter_commits(max_count=count):
-                yield {
-                    "sha": commit.hexsha[:7],
-                    "message": str(commit.message).strip().split("\n")[0],
-                    "author": str(commit.author),
-                    "date": commit.committed_datetime.isoformat(),
-                }
-        except (GitCommandError, ValueError, OSError):
-            return
+        # One record per commit (-z), fields separated by the unit separator
+        for raw in self._git_stream(
+            "log", "-z", f"--max-count={count}", "--format=%H%x1f%an%x1f%cI%x1f%B"
+        ):
+            if not raw:
+                continue
+            record = raw.decode("utf-8", "replace")
+            sha, author, date, message = record.split("\x1f", 3)
+            yield {
+                "sha": sha[:7],
+                "message": message.strip().split("\n")[0],
+                "author": author,
+                "date": date,
+            }
 
     def get_commits_detailed(
         self, count: int = 20, branch: str | None = None
@@ -263,6 +520,8 @@ class GitManager:
             - is_merge: Whether this is a merge commit
             - parent_count: Number of parents
         """
+        from git import GitCommandError
+
         commits = []
         try:
             ref = branch if branch and self.branch_exists(branch) else None
@@ -333,8 +592,11 @@ class GitManager:
             logging.debug("Failed to get tags for commit %s", sha)
         return tags
 
+    @_mutates
     def delete_branch(self, name: str, force: bool = False) -> None:
         """Delete a branch."""
+        from git import GitCommandError
+
         if not self.branch_exists(name):
             raise BranchNotFoundError(f"Branch not found: {name}")
 
@@ -357,16 +619,21 @@ class GitManager:
 
     def has_remote(self) -> bool:
         """Check if a remote 'origin' exists."""
-        return "origin" in [r.name for r in self.repo.remotes]
+        return self._cached(
+            "has_remote", lambda: "origin" in [r.name for r in self.repo.remotes]
+        )
 
     def get_remote_url(self) -> str | None:
         """Get the URL of the 'origin' remote."""
         if not self.has_remote():
             return None
-        return self.repo.remotes.origin.url
+        return self._cached("remote_url", lambda: self.repo.remotes.origin.url)
 
+    @_mutates
     def set_remote(self, url: str) -> None:
         """Set or update the 'origin' remote URL."""
+        from git import GitCommandError
+
         try:
             if self.has_remote():
                 self.repo.remotes.origin.set_url(url)
@@ -375,17 +642,54 @@ class GitManager:
         except (GitCommandError, ValueError) as e:
             raise GitOperationError(f"Failed to set remote: {e}")
 
-    def fetch(self) -> None:
-        """Fetch from origin remote."""
+    def fetch(self, force: bool = False) -> None:
+        """Fetch from origin remote.
+
+        Runs ``git fetch`` directly: the per-ref FetchInfo objects GitPython
+        would build are never used. Remote-tracking refs deleted upstream
+        are pruned so sync checks do not see stale branches.
+
+        Args:
+            force: Fetch even if the last fetch was under
+                ``FETCH_MIN_INTERVAL`` seconds ago
+        """
         if not self.has_remote():
             raise GitOperationError(
                 "No remote configured. Use 'dot-man remote set <url>' first."
             )
-        try:
-            self.repo.remotes.origin.fetch()
-        except (GitCommandError, ValueError) as e:
-            raise GitOperationError(f"Failed to fetch: {e}")
+        if not (force or self._fetch_due()):
+            return
+        result = self._git("fetch", "--quiet", "--prune", "origin")
+        if result.returncode != 0:
+            raise GitOperationError(f"Failed to fetch: {result.stderr.strip()}")
+        self._last_fetch = time.monotonic()
+        # Remote-tracking refs moved
+        self._invalidate()
+
+    def _fetch_due(self) -> bool:
+        """Whether FETCH_MIN_INTERVAL has passed since the last fetch."""
+        return (
+            not self._last_fetch
+            or time.monotonic() - self._last_fetch >= self.FETCH_MIN_INTERVAL
+        )
+
+    def _is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Check whether ``ancestor`` is reachable from ``descendant``."""
+        result = self._git("merge-base", "--is-ancestor", ancestor, descendant)
+        return result.returncode == 0
+
+    def _remote_branch_exists(self, branch: str) -> bool:
+        """Check for ``origin/<branch>`` by resolving that one ref.
+
+        Avoids enumerating and parsing every remote ref just to test
+        membership.
+        """
+        result = self._git(
+            "rev-parse", "--verify", "--quiet", f"refs/remotes/origin/{branch}"
+        )
+        return result.returncode == 0
 
+    @_mutates
     def pull(self, rebase: bool = True) -> str:
         """Pull from origin remote.
 
@@ -395,25 +699,31 @@ class GitManager:
         Returns:
             Summary message of what happened.
         """
+        from git import GitCommandError
+
         if not self.has_remote():
             raise GitOperationError(
                 "No remote configured. Use 'dot-man remote set <url>' first."
             )
 
-        stashed = False
+        stash_sha = ""
         try:
             current = self.current_branch()
-            # Check if remote branch exists
-            remote_refs = [ref.name for ref in self.repo.remotes.origin.refs]
-            remote_branch = f"origin/{current}"
-
-            if remote_branch not in remote_refs:
+            if not self._remote_branch_exists(current):
                 return f"Remote branch '{current}' not found. Nothing to pull."
 
-            # Stash uncommitted changes if dirty
-            if self.is_dirty():
-                self.repo.git.stash("save", "dot-man-auto-stash")
-                stashed = True
+            # Remote refs fetched moments ago already tell whether HEAD
+            # contains origin; if so skip the stash and the network round trip
+            if not self._fetch_due() and self._is_ancestor(
+                f"refs/remotes/origin/{current}", "HEAD"
+            ):
+                return "Already up to date."
+
+            # Record uncommitted changes as a stash commit without touching
+            # the stash stack, so a user's own stashes are never popped
+            stash_sha = self.repo.git.stash("create", _AUTO_STASH_MESSAGE)
+            if stash_sha:
+                self.repo.git.reset("--hard")
 
             # Perform the pull
             if rebase:
@@ -422,11 +732,11 @@ class GitManager:
                 result = self.repo.git.pull("origin", current)
 
             # Restore stashed changes
-            if stashed:
+            if stash_sha:
                 try:
-                    self.repo.git.stash("pop")
+                    self._apply_auto_stash(stash_sha)
                 except GitCommandError as stash_error:
-                    # Stash pop failed - likely a conflict
+                    # Applying failed - likely a conflict
                     return (
                         f"{result if result else 'Pulled successfully.'}\n"
                         f"⚠ Warning: Stash pop failed. Your changes are in 'git stash'. "
@@ -437,9 +747,9 @@ class GitManager:
             return result if result else "Already up to date."
         except GitCommandError as e:
             # Restore stash even on error
-            if stashed:
+            if stash_sha:
                 try:
-                    self.repo.git.stash("pop")
+                    self._apply_auto_stash(stash_sha)
                 except Exception as stash_err:
                     logging.warning(
                         "Failed to restore stash after pull conflict: %s", stash_err
@@ -454,21 +764,41 @@ class GitManager:
             raise GitOperationError(f"Failed to pull: {e.stderr}")
         except OSError as e:
             # Restore stash even on error
-            if stashed:
+            if stash_sha:
                 try:
-                    self.repo.git.stash("pop")
+                    self._apply_auto_stash(stash_sha)
                 except Exception as stash_err:
                     logging.warning(
                         "Failed to restore stash after pull OSError: %s", stash_err
                     )
             raise GitOperationError(f"Failed to pull: {e}")
 
+    def _apply_auto_stash(self, stash_sha: str) -> None:
+        """Re-apply changes recorded by ``git stash create``.
+
+        If they do not apply cleanly the stash commit is stored on the
+        stash stack, so ``git stash pop`` can still recover it.
+
+        Raises:
+            GitCommandError: If the changes could not be applied
+        """
+        from git import GitCommandError
+
+        try:
+            self.repo.git.stash("apply", stash_sha)
+        except GitCommandError:
+            self.repo.git.stash("store", "-m", _AUTO_STASH_MESSAGE, stash_sha)
+            raise
+
+    @_mutates
     def push(self, set_upstream: bool = True) -> str:
         """Push to origin remote.
 
         Returns:
             Summary message of what happened.
         """
+        from git import GitCommandError
+
         if not self.has_remote():
             raise GitOperationError(
                 "No remote configured. Use 'dot-man remote set <url>' first."
@@ -492,34 +822,16 @@ class GitManager:
     def get_branch_stats(self, branch_name: str) -> dict:
         """Get stats for a specific branch.
 
+        Counts come straight from git (``rev-list --count`` and
+        ``ls-tree -r``) rather than from commit and tree objects built
+        in Python.
+
         Returns:
             Dictionary with: commit_count, last_commit_date, last_commit_msg, file_count
         """
-        try:
-            branch = self.repo.heads[branch_name]
-            commits = list(self.repo.iter_commits(branch, max_count=100))
-
-            last_commit = commits[0] if commits else None
-
-            # Count files in branch
-            tree = branch.commit.tree
-            file_count = sum(1 for _ in tree.traverse() if _.type == "blob")  # type: ignore
-
-            return {
-                "commit_count": len(commits),
-                "last_commit_date": (
-                    last_commit.committed_datetime.strftime("%Y-%m-%d %H:%M")
-                    if last_commit
-                    else "N/A"
-                ),
-                "last_commit_msg": (
-                    str(last_commit.message).strip().split("\n")[0][:50]
-                    if last_commit
-                    else "N/A"
-                ),
-                "file_count": file_count,
-            }
-        except (GitCommandError, ValueError, IndexError, OSError):
+        ref = f"refs/heads/{branch_name}"
+        count = self._git("rev-list", "--count", "--max-count=100", ref)
+        if count.returncode != 0:
             return {
                 "commit_count": 0,
                 "last_commit_date": "N/A",
@@ -527,12 +839,31 @@ class GitManager:
                 "file_count": 0,
             }
 
+        last = self._git(
+            "log", "-1", "--date=format:%Y-%m-%d %H:%M", "--format=%cd%x1f%B", ref
+        )
+        last_date, _, last_msg = last.stdout.partition("\x1f")
+
+        # Count files in branch (-z keeps newlines in names unambiguous)
+        files = self._git("ls-tree", "-r", "-z", "--name-only", ref)
+
+        return {
+            "commit_count": int(count.stdout),
+            "last_commit_date": last_date or "N/A",
+            "last_commit_msg": (
+                last_msg.strip().split("\n")[0][:50] if last_date else "N/A"
+            ),
+            "file_count": files.stdout.count("\0"),
+        }
+
     def get_all_branch_stats(self) -> list[dict]:
         """Get stats for all branches efficiently using git for-each-ref.
 
         Returns:
             List of dicts with: name, last_commit_date, last_commit_msg
         """
+        from git import GitCommandError
+
         try:
             # format: refname:short|committerdate:iso|subject
             output = self.repo.git.for_each_ref(
@@ -563,23 +894,47 @@ class GitManager:
         except (GitCommandError, ValueError, OSError):
             return []
 
-    def get_sync_status(self) -> dict:
+    def get_sync_status(self, force_refresh: bool = False) -> dict:
         """Get sync status with remote.
 
+        A status computed less than ``SYNC_STATUS_TTL`` seconds ago, with no
+        repository change since, is reused, and fetches are rate limited by
+        :meth:`fetch`, so polling callers do not spawn git on every call.
+
+        Args:
+            force_refresh: Fetch and recompute regardless of cached results
+
         Returns:
             Dictionary with: ahead, behind, remote_configured
         """
+        from git import GitCommandError
+
         if not self.has_remote():
             return {"ahead": 0, "behind": 0, "remote_configured": False}
 
+        cached = self._sync_status
+        if (
+            not force_refresh
+            and cached is not None
+            and cached[0] == self._epoch
+            and time.monotonic() - cached[1] < self.SYNC_STATUS_TTL
+        ):
+            return dict(cached[2])
+
         try:
-            self.fetch()
-            current = self.current_branch()
+            if force_refresh or self._fetch_due():
+                # The fetch is network bound; resolve the local branch while
+                # it runs. Everything after this depends on the fetched refs.
+                fetched = _fetch_pool().submit(self.fetch, force=force_refresh)
+                try:
+                    current = self.current_branch()
+                finally:
+                    fetched.result()
+            else:
+                current = self.current_branch()
             remote_branch = f"origin/{current}"
 
-            # Check if remote branch exists
-            remote_refs = [ref.name for ref in self.repo.remotes.origin.refs]
-            if remote_branch not in remote_refs:
+            if not self._remote_branch_exists(current):
                 return {
                     "ahead": 0,
                     "behind": 0,
@@ -587,16 +942,23 @@ class GitManager:
                     "remote_branch_exists": False,
                 }
 
-            # Count ahead/behind
-            ahead = len(list(self.repo.iter_commits(f"{remote_branch}..{current}")))
-            behind = len(list(self.repo.iter_commits(f"{current}..{remote_branch}")))
+            # Count ahead/behind in one rev-list: left is ours, right is theirs
+            result = self._git(
+                "rev-list", "--left-right", "--count", f"{current}...{remote_branch}"
+            )
+            if result.returncode != 0:
+                raise ValueError(result.stderr)
+            ahead_str, behind_str = result.stdout.split()
+            ahead, behind = int(ahead_str), int(behind_str)
 
-            return {
+            status = {
                 "ahead": ahead,
                 "behind": behind,
                 "remote_configured": True,
                 "remote_branch_exists": True,
             }
+            self._sync_status = (self._epoch, time.monotonic(), status)
+            return dict(status)
         except (GitCommandError, ValueError, OSError):
             return {"ahead": 0, "behind": 0, "remote_configured": True, "error": True}
 
@@ -607,14 +969,22 @@ class GitManager:
             branch: Branch name to read from
             file_path: Relative path within the repo
 
+        Blobs are read through GitPython's persistent ``git cat-file --batch``
+        process, so reading many files costs one git process rather than a
+        ``git show`` per file. Content is returned exactly as stored.
+
         Returns:
             File content as string, or None if file doesn't exist
         """
-        try:
-            # Use git show to read file from branch
-            from typing import cast
+        from git import GitCommandError
 
-            return cast(str | None, self.repo.git.show(f"{branch}:{file_path}"))
+        try:
+            _, type_name, _, data = self.repo.git.get_object_data(
+                f"{branch}:{file_path}"
+            )
         except (GitCommandError, ValueError, OSError):
-            # File doesn't exist in that branch
+            # File (or branch) doesn't exist
+            return None
+        if type_name != b"blob":
             return None
+        return data.decode("utf-8", "replace")
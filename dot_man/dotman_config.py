@@ -2,123 +2,94 @@
 
 __all__ = ["DotManConfig", "VALID_SECTION_KEYS"]
 
+import copy
 import logging
+import os
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Iterator, cast
 
 from .constants import (
     CONFIG_FILE_PRIORITY,
-    DOT_MAN_TOML,
+    DEFAULT_CONFIG_PATHS,
     REPO_DIR,
     VALID_UPDATE_STRATEGIES,
 )
 from .exceptions import ConfigurationError, ConfigValidationError
-from .global_config import GlobalConfig, load_config_file, write_config_file
-from .section import Section
-
-VALID_SECTION_KEYS = {
-    "paths",
-    "repo_base",
-    "repo_path",
-    "secrets_filter",
-    "update_strategy",
-    "include",
-    "exclude",
-    "pre_deploy",
-    "post_deploy",
-    "on_activate",
-    "on_deactivate",
-    "inherits",
-    "ignored_directories",
-    "follow_symlinks",
-    "deploy_method",
-    "encrypted",
-    "encryption_method",
-    "encryption_recipient",
-}
+from .global_config import (
+    GlobalConfig,
+    changed_config_keys,
+    config_file_stamp,
+    config_fingerprint,
+    load_config_data,
+    load_config_doc,
+    write_config_file,
+)
+from .section import VALID_DEPLOY_METHODS, Section
+
+VALID_SECTION_KEYS = frozenset(
+    {
+        "paths",
+        "repo_base",
+        "repo_path",
+        "secrets_filter",
+        "update_strategy",
+        "include",
+        "exclude",
+        "pre_deploy",
+        "post_deploy",
+        "on_activate",
+        "on_deactivate",
+        "inherits",
+        "ignored_directories",
+        "follow_symlinks",
+        "deploy_method",
+        "encrypted",
+        "encryption_method",
+        "encryption_recipient",
+    }
+)
 """Canonical set of valid keys for section config."""
 
+# Set form for O(1) membership tests; the public list keeps its order for
+# error messages
+_VALID_UPDATE_STRATEGIES_SET = frozenset(VALID_UPDATE_STRATEGIES)
+_VALID_DEPLOY_METHODS_SET = frozenset(VALID_DEPLOY_METHODS)
 
-class DotManConfig:
-    """Parser for the dot-man configuration file (TOML/YAML)."""
+# The default repository as imported; DEFAULT_CONFIG_PATHS is only reused when
+# a config is opened on this exact directory
+_DEFAULT_REPO_DIR = REPO_DIR
 
-    def __init__(
-        self, repo_path: Path | None = None, global_config: GlobalConfig | None = None
-    ):
-        self._data: dict = {}
-        self._repo_path = repo_path or REPO_DIR
 
-        # Find first existing config file in priority order
-        config_files = [self._repo_path / f for f in CONFIG_FILE_PRIORITY]
-        existing = [f for f in config_files if f.exists()]
+def _expand_config_path(path: str, home: str) -> Path:
+    """Expand ~ and environment variables in a configured path.
 
-        if len(existing) > 1:
-            logging.warning(
-                f"Multiple config files found: {[f.name for f in existing]}. "
-                f"Using {existing[0].name} (TOML > YAML priority)"
-            )
-
-        self._path = existing[0] if existing else self._repo_path / DOT_MAN_TOML
-
-        # Track config format for save operations
-        self._config_format = self._path.suffix.replace(".", "")
-
-        self._global_config = global_config
-        self._doc: Any = None  # For preserving comments
-        self._dirty: bool = False
-
-    @property
-    def repo_path(self) -> Path:
-        """Get the repository path."""
-        return self._repo_path
-
-    def load(self) -> None:
-        """Load the dot-man configuration file.
-
-        Supports TOML (.toml) and YAML (.yaml/.yml) formats.
-        """
-        self._data, self._doc = load_config_file(self._path)
-        self._dirty = False
-
-        warnings = self._validate_schema()
-        if warnings:
-            for w in warnings:
-                logging.warning(f"Config warning: {w}")
-
-    def _validate_schema(self) -> list[str]:
-        """Validate config structure on load."""
-        warnings: list[str] = []
+    The common "~/..." and "~" forms are rewritten with the pre-resolved
+    home directory; only "~user" forms fall back to os.path.expanduser.
+    """
+    if path.startswith("~/"):
+        path = home + path[1:]
+    elif path == "~":
+        path = home or os.sep
+    elif path.startswith("~"):
+        path = os.path.expanduser(path)
+    return Path(os.path.expandvars(path))
 
-        for name, section in self._data.items():
-            if name in ("templates", "secrets"):
-                continue
-            if isinstance(section, dict):
-                for key in section:
-                    if key not in VALID_SECTION_KEYS:
-                        warnings.append(f"[{name}]: Unknown key '{key}'")
-        return warnings
 
-    def save(self, force: bool = False) -> None:
-        """Save the dot-man.toml configuration file.
+def _unknown_keys(table: dict) -> list[str]:
+    """Return keys of a section table that are not valid section keys.
 
-        Args:
-            force: Save even if not dirty
-        """
-        if not self._dirty and not force:
-            return
-        write_config_file(self._path, self._data, self._doc)
-        self._dirty = False
+    A C-level set difference decides whether any key is unknown; only then
+    is the table walked again to report the offenders in file order.
+    """
+    unknown = table.keys() - VALID_SECTION_KEYS
+    if not unknown:
+        return []
+    return [key for key in table if key in unknown]
 
-    def create_default(self) -> None:
-        """Create minimal default config with helpful examples."""
-        # Start with empty config - examples will be in comments
-        self._data = {}
-        self._dirty = True
-        self.save(force=True)
 
-        # Append helpful comments and documentation with example sections
-        with open(self._path, "a") as f:
-            f.write("""
+# Helpful comments and documentation with example sections, appended to
+# freshly created configs
+_DEFAULT_CONFIG_EXAMPLES = """
 # ============================================================================
 # dot-man Configuration Examples
 # ============================================================================
@@ -225,82 +196,311 @@ class DotManConfig:
 # update_strategy = "ignore"       # Skip if file exists
 #
 # Full documentation: https://github.com/BeshoyEhab/dot-man#configuration
-""")
+"""
+
+
+# Above this many uncached parent directories, validate() lists them from a
+# thread pool; below it the pool's setup cost outweighs the overlap
+_PARALLEL_LISTING_THRESHOLD = 16
+
+
+def _list_directory(parent: Path) -> dict[str, os.DirEntry] | None:
+    """Return a directory's entries by name, or None if it cannot be read."""
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def _prefetch_listings(
+    paths: list[Path], listings: dict[Path, dict[str, os.DirEntry] | None]
+) -> None:
+    """Fill listings for the parents of paths concurrently when there are many.
+
+    Existence checks are bound by syscall latency rather than CPU, which on
+    slow or network filesystems makes overlapping them worthwhile.
+    """
+    parents = list(dict.fromkeys(p.parent for p in paths if p.parent not in listings))
+    if len(parents) <= _PARALLEL_LISTING_THRESHOLD:
+        return  # _path_exists lists these lazily
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(32, len(parents))) as executor:
+        listings.update(zip(parents, executor.map(_list_directory, parents)))
+
+
+def _path_exists(
+    path: Path, listings: dict[Path, dict[str, os.DirEntry] | None]
+) -> bool:
+    """Check existence via a cached listing of the parent directory.
+
+    Only plain (non-symlink) entries found in the listing are trusted;
+    anything else falls back to ``path.exists()`` so symlink targets and
+    case-insensitive filesystems behave exactly as before.
+    """
+    parent = path.parent
+    if parent not in listings:
+        listings[parent] = _list_directory(parent)
+    entries = listings[parent]
+    if entries is not None:
+        entry = entries.get(path.name)
+        if entry is not None and not entry.is_symlink():
+            return True
+    return path.exists()
+
+
+class DotManConfig:
+    """Parser for the dot-man configuration file (TOML/YAML)."""
+
+    def __init__(
+        self, repo_path: Path | None = None, global_config: GlobalConfig | None = None
+    ):
+        self._data: dict = {}
+        self._repo_path = repo_path or REPO_DIR
+
+        # Find first existing config file in priority order, probing all
+        # candidates with one directory listing instead of a stat each
+        if self._repo_path is _DEFAULT_REPO_DIR:
+            config_files = DEFAULT_CONFIG_PATHS
+        else:
+            config_files = tuple(self._repo_path / f for f in CONFIG_FILE_PRIORITY)
+        try:
+            present = set(os.listdir(self._repo_path))
+        except OSError:
+            existing = [f for f in config_files if f.exists()]
+        else:
+            existing = [f for f in config_files if f.name in present]
+
+        if len(existing) > 1:
+            logging.warning(
+                f"Multiple config files found: {[f.name for f in existing]}. "
+                f"Using {existing[0].name} (TOML > YAML priority)"
+            )
+
+        # CONFIG_FILE_PRIORITY starts with DOT_MAN_TOML, the default format
+        self._path = existing[0] if existing else config_files[0]
+
+        # Track config format for save operations
+        self._config_format = self._path.suffix.replace(".", "")
+
+        self._global_config = global_config
+        self._doc: Any = None  # For preserving comments
+        # True after load() until the document is first needed by save()
+        self._doc_deferred: bool = False
+        # config_file_stamp of the file self._data was loaded from
+        self._loaded_stamp: tuple[int, int, int, int] | None = None
+        self._dirty: bool = False
+        # Fingerprint of the data as last read from or written to disk
+        self._saved_hash: dict[str, int] | None = None
+        # Resolved sections by name; cleared whenever self._data changes
+        self._section_cache: dict[str, Section] = {}
+        # Home directory for "~/" paths, resolved once rather than per path
+        self._home = os.path.expanduser("~").rstrip(os.sep)
+
+    @property
+    def repo_path(self) -> Path:
+        """Get the repository path."""
+        return self._repo_path
+
+    @property
+    def _cache_path(self) -> Path:
+        """Parsed-config cache, kept inside .git so it is never committed."""
+        return self._repo_path / ".git" / f"{self._path.name}.cache"
+
+    def load(self) -> None:
+        """Load the dot-man configuration file.
+
+        Supports TOML (.toml) and YAML (.yaml/.yml) formats.
+        """
+        # Stamped before reading: a change in between then reads as a change
+        self._loaded_stamp = config_file_stamp(self._path)
+        self._data = load_config_data(self._path, cache_path=self._cache_path)
+        # The comment-preserving document is only parsed if we save
+        self._doc = None
+        self._doc_deferred = True
+        self._saved_hash = config_fingerprint(self._data)
+        self._section_cache.clear()
+        self._dirty = False
+
+        warnings = self._validate_schema()
+        if warnings:
+            for w in warnings:
+                logging.warning(f"Config warning: {w}")
+
+    def _validate_schema(self) -> list[str]:
+        """Validate config structure on load."""
+        warnings: list[str] = []
+
+        for name, section in self._data.items():
+            if name in ("templates", "secrets"):
+                continue
+            if isinstance(section, dict):
+                for key in _unknown_keys(section):
+                    warnings.append(f"[{name}]: Unknown key '{key}'")
+        return warnings
+
+    def save(self, force: bool = False) -> None:
+        """Save the dot-man.toml configuration file.
+
+        Args:
+            force: Save even if not dirty
+        """
+        if not self._dirty and not force:
+            return
+        fingerprint = config_fingerprint(self._data)
+        if fingerprint == self._saved_hash and self._path.exists():
+            # Nothing changed since the last load/save; skip the rewrite
+            self._dirty = False
+            return
+        # Only tables that changed since the last load/save are merged into
+        # the comment-preserving document
+        changed_keys = changed_config_keys(fingerprint, self._saved_hash)
+        if self._doc_deferred:
+            self._doc = load_config_doc(self._path, missing_ok=True)
+            self._doc_deferred = False
+            stamp = config_file_stamp(self._path)
+            if stamp is None or stamp != self._loaded_stamp:
+                # The file changed after load() (or is too recent to tell),
+                # so the document may not hold our unchanged tables: merge
+                # every key
+                changed_keys = None
+        write_config_file(
+            self._path,
+            self._data,
+            self._doc,
+            changed_keys=changed_keys,
+        )
+        self._cache_path.unlink(missing_ok=True)
+        self._saved_hash = fingerprint
+        self._dirty = False
+
+    def create_default(self, with_examples: bool = True) -> None:
+        """Create minimal default config, with helpful examples by default."""
+        # Start with empty config - examples will be in comments, written
+        # together with the (empty) data in one go
+        self._data = {}
+        self._section_cache.clear()
+        write_config_file(
+            self._path,
+            self._data,
+            footer=_DEFAULT_CONFIG_EXAMPLES if with_examples else "",
+        )
+        self._cache_path.unlink(missing_ok=True)
+        self._saved_hash = config_fingerprint(self._data)
+        self._dirty = False
+
+    def iter_sections(self) -> Iterator[str]:
+        """Yield section names (excluding templates) without resolving them.
+
+        Sections are only built when passed to get_section, so callers that
+        stop early never pay for resolving the rest.
+        """
+        for name, value in self._data.items():
+            if name != "templates" and isinstance(value, dict):
+                yield name
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_sections()
 
     def get_section_names(self) -> list[str]:
         """Get all section names (excluding templates)."""
-        return [
-            name
-            for name in self._data.keys()
-            if name != "templates" and isinstance(self._data[name], dict)
-        ]
+        return list(self.iter_sections())
 
     def get_local_templates(self) -> dict[str, Any]:
         """Get templates defined in this file."""
         return cast(dict[str, Any], self._data.get("templates", {}))
 
-    def _resolve_template(self, name: str) -> dict[str, Any]:
-        """Resolve a template by name, checking local first then global."""
-        # Check local templates
-        local = self.get_local_templates().get(name)
-        if local:
-            return cast(dict[str, Any], local)
-
-        # Check global templates
-        if self._global_config:
-            global_template = self._global_config.get_template(name)
-            if global_template:
-                return global_template
-
-        return {}
-
     def _merge_settings(self, base: dict, override: dict) -> dict:
-        """Merge settings, with override taking precedence."""
-        result = base.copy()
+        """Merge override into base in place, returning base."""
         for key, value in override.items():
             if key == "inherits":
                 continue  # Don't inherit the inherits key
-            result[key] = value
-        return result
+            base[key] = value
+        return base
 
     def get_section(self, name: str) -> Section:
-        """Get a fully resolved section with inheritance applied."""
+        """Get a fully resolved section with inheritance applied.
+
+        Resolution is memoized until the config is reloaded or a section is
+        added, updated or removed. Each call still returns its own shallow
+        copy, so callers may reassign attributes without affecting others.
+        """
+        cached = self._section_cache.get(name)
+        if cached is not None:
+            return copy.copy(cached)
+        return copy.copy(self._resolve_section(name, self._resolution_context()))
+
+    def get_all_sections(self) -> list[Section]:
+        """Get every section, resolved in one pass.
+
+        Defaults and template tables are looked up once for the whole pass
+        rather than once per section. Like get_section, results are
+        memoized and each returned Section is the caller's own copy.
+        """
+        context = None
+        sections = []
+        for name in self.iter_sections():
+            section = self._section_cache.get(name)
+            if section is None:
+                if context is None:
+                    context = self._resolution_context()
+                section = self._resolve_section(name, context)
+            sections.append(copy.copy(section))
+        return sections
+
+    def _resolution_context(self) -> tuple[dict, dict, dict]:
+        """Return (defaults, local templates, global templates) for resolving."""
+        if self._global_config is None:
+            return {}, self.get_local_templates(), {}
+        return (
+            self._global_config.get_defaults(),
+            self.get_local_templates(),
+            self._global_config.get_all_templates(),
+        )
+
+    def _resolve_section(self, name: str, context: tuple[dict, dict, dict]) -> Section:
+        """Resolve and memoize a section; the result is shared, not copied."""
         if name not in self._data or name == "templates":
             raise ConfigurationError(f"Section not found: {name}")
 
         raw = self._data[name]
+        defaults, local_templates, global_templates = context
 
-        # Start with global defaults
-        settings = {}
-        if self._global_config:
-            settings = self._global_config.get_defaults().copy()
-
-        # Apply inherited templates (in order)
         inherits = raw.get("inherits", [])
         if isinstance(inherits, str):
             inherits = [inherits]  # Support single string for convenience
 
-        for template_name in inherits:
-            template = self._resolve_template(template_name)
-            settings = self._merge_settings(settings, template)
-
-        # Apply section-specific settings
-        settings = self._merge_settings(settings, raw)
+        if inherits:
+            # Layer defaults < templates (in order) < section into one copy;
+            # local templates win over global ones
+            settings = dict(defaults)
+            for template_name in inherits:
+                template = (
+                    local_templates.get(template_name)
+                    or global_templates.get(template_name)
+                    or {}
+                )
+                self._merge_settings(settings, template)
+            self._merge_settings(settings, raw)
+        else:
+            # Common case: a single C-level merge of defaults and section
+            settings = {**defaults, **raw}
+            settings.pop("inherits", None)
 
         # Parse paths with environment variable expansion
-        import os
-
         paths_raw = settings.get("paths", [])
         if isinstance(paths_raw, str):
             paths_raw = [paths_raw]
-        paths = [Path(os.path.expandvars(os.path.expanduser(p))) for p in paths_raw]
+        home = self._home
+        paths = [_expand_config_path(p, home) for p in paths_raw]
 
         if not paths:
             raise ConfigValidationError(f"Section [{name}] must have at least one path")
 
         # Validate update_strategy
         strategy = settings.get("update_strategy", "replace")
-        if strategy not in VALID_UPDATE_STRATEGIES:
+        if strategy not in _VALID_UPDATE_STRATEGIES_SET:
             raise ConfigValidationError(
                 f"Invalid update_strategy '{strategy}' in [{name}]. "
                 f"Valid options: {VALID_UPDATE_STRATEGIES}"
@@ -308,15 +508,14 @@ class DotManConfig:
 
         # Validate deploy_method
         deploy_method = settings.get("deploy_method", "copy")
-        valid_methods = ["copy", "symlink"]
-        if deploy_method not in valid_methods:
+        if deploy_method not in _VALID_DEPLOY_METHODS_SET:
             raise ConfigValidationError(
                 f"Invalid deploy_method '{deploy_method}' in [{name}]. "
-                f"Valid options: {valid_methods}"
+                f"Valid options: {VALID_DEPLOY_METHODS}"
             )
 
         # Build Section object
-        return Section(
+        section = Section(
             name=name,
             paths=paths,
             repo_base=settings.get("repo_base", name),
@@ -332,8 +531,10 @@ class DotManConfig:
             inherits=inherits,
             ignored_directories=settings.get("ignored_directories"),
             follow_symlinks=settings.get("follow_symlinks"),
-            deploy_method=settings.get("deploy_method", "copy"),
+            deploy_method=deploy_method,
         )
+        self._section_cache[name] = section
+        return section
 
     def add_section(
         self,
@@ -350,14 +551,14 @@ class DotManConfig:
         if not paths:
             raise ConfigurationError("Section must have at least one path")
 
-        # Validate paths
+        # Validate paths: strip once and test absoluteness on the string,
+        # without building a Path object per entry
         cleaned_paths = []
         for p in paths:
-            if not isinstance(p, str) or not p.strip():
+            clean_p = p.strip() if isinstance(p, str) else ""
+            if not clean_p:
                 raise ConfigurationError("Paths must be non-empty strings")
-
-            clean_p = p.strip()
-            if Path(clean_p).is_absolute():
+            if os.path.isabs(clean_p):
                 raise ConfigurationError(
                     f"Paths must be relative (to home or checkout): {clean_p}"
                 )
@@ -372,12 +573,13 @@ class DotManConfig:
             "repo_base": repo_base or name,
         }
 
-        # Add optional fields
-        for key in VALID_SECTION_KEYS - {"paths", "repo_base"}:
-            if key in kwargs and kwargs[key]:
-                section_data[key] = kwargs[key]
+        # Add optional fields, in the caller's (deterministic) order
+        for key, value in kwargs.items():
+            if value and key in VALID_SECTION_KEYS and key not in section_data:
+                section_data[key] = value
 
         self._data[name] = section_data
+        self._section_cache.clear()
         self._dirty = True
 
     def update_section(self, name: str, **kwargs) -> None:
@@ -393,16 +595,23 @@ class DotManConfig:
         if name not in self._data or name == "templates":
             raise ConfigurationError(f"Section not found: {name}")
 
+        section = self._data[name]
+        changed = False
         for key, value in kwargs.items():
             if key not in VALID_SECTION_KEYS:
                 raise ConfigurationError(f"Unknown key: {key}")
             if value is None:
                 # Remove the key if set to None
-                self._data[name].pop(key, None)
-            else:
-                self._data[name][key] = value
+                if key in section:
+                    del section[key]
+                    changed = True
+            elif key not in section or section[key] != value:
+                section[key] = value
+                changed = True
 
-        self._dirty = True
+        if changed:
+            self._section_cache.clear()
+            self._dirty = True
 
     def remove_section(self, name: str) -> None:
         """Remove a section from the configuration.
@@ -416,42 +625,62 @@ class DotManConfig:
         if name not in self._data or name == "templates":
             raise ConfigurationError(f"Section not found: {name}")
         del self._data[name]
+        self._section_cache.clear()
         self._dirty = True
 
     def validate(self) -> list[str]:
         """Validate the configuration file. Returns list of warnings."""
         warnings = []
+        # Directory listings by parent, so sibling paths share one scandir
+        listings: dict[Path, dict[str, os.DirEntry] | None] = {}
+        # Defaults and template tables are looked up once for the whole pass
+        context = self._resolution_context()
+        _, local_templates, global_templates = context
+
+        # Resolve every section once (memoized, shared rather than copied)
+        # so all parent directories can be listed before the checks start
+        resolved: list[tuple[str, Section | Exception]] = []
+        for name in self.iter_sections():
+            resolved_section = self._section_cache.get(name)
+            if resolved_section is None:
+                try:
+                    resolved_section = self._resolve_section(name, context)
+                except Exception as e:
+                    resolved.append((name, e))
+                    continue
+            resolved.append((name, resolved_section))
+        _prefetch_listings(
+            [
+                path
+                for _, section in resolved
+                if isinstance(section, Section)
+                for path in section.paths
+            ],
+            listings,
+        )
+
+        for name, section in resolved:
+            if not isinstance(section, Section):
+                warnings.append(f"[{name}]: {section}")
+                continue
 
-        for name in self.get_section_names():
-            try:
-                section = self.get_section(name)
-
-                # Check paths exist
-                for path in section.paths:
-                    if not path.exists():
-                        warnings.append(f"[{name}]: Path does not exist: {path}")
-
-                # Check inherits resolve
-                for template in section.inherits:
-                    # Check if template exists (empty template is valid)
-                    local_templates = self.get_local_templates()
-                    global_templates = (
-                        self._global_config.get_all_templates()
-                        if self._global_config
-                        else {}
-                    )
-                    if (
-                        template not in local_templates
-                        and template not in global_templates
-                    ):
-                        warnings.append(f"[{name}]: Template not found: {template}")
-
-                # Check for invalid keys
-                for key in self._data[name]:
-                    if key not in VALID_SECTION_KEYS:
-                        warnings.append(f"[{name}]: Unknown key '{key}'")
-
-            except Exception as e:
-                warnings.append(f"[{name}]: {e}")
+            # Check paths exist
+            for path in section.paths:
+                try:
+                    exists = _path_exists(path, listings)
+                except OSError as e:
+                    warnings.append(f"[{name}]: {e}")
+                    continue
+                if not exists:
+                    warnings.append(f"[{name}]: Path does not exist: {path}")
+
+            # Check inherits resolve (empty template is valid)
+            for template in section.inherits:
+                if template not in local_templates and template not in global_templates:
+                    warnings.append(f"[{name}]: Template not found: {template}")
+
+            # Check for invalid keys
+            for key in _unknown_keys(self._data[name]):
+                warnings.append(f"[{name}]: Unknown key '{key}'")
 
         return warnings
@@ -15,8 +15,11 @@ from dataclasses import dataclass
 from enum import Enum
 
 
-class ErrorCategory(Enum):
-    """Categorizes errors for user-friendly diagnostics."""
+class ErrorCategory(str, Enum):
+    """Categorizes errors for user-friendly diagnostics.
+
+    Members are strings, so they compare equal to their plain values.
+    """
 
     SECRETS = "secrets"  # Secrets detected / redaction issues
     PERMISSION = "permission"  # File permission denied
@@ -29,7 +32,7 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"  # Fallback
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ErrorDiagnostic:
     """Rich error diagnostic for user display."""
 
@@ -50,6 +53,10 @@ class ErrorDiagnostic:
             SecretsDetectedError,
         )
 
+        # The message text feeds several checks; render and fold it once
+        message = str(exc)
+        lowered = message.lower()
+
         if isinstance(exc, KeyboardInterrupt):
             return cls(
                 ErrorCategory.INTERRUPTED,
@@ -58,59 +65,53 @@ class ErrorDiagnostic:
                 "Run the command again to retry",
             )
         # Check for built-in PermissionError first
-        if (
-            isinstance(exc, builtins.PermissionError)
-            or "permission denied" in str(exc).lower()
-        ):
+        if isinstance(exc, builtins.PermissionError) or "permission denied" in lowered:
             return cls(
                 ErrorCategory.PERMISSION,
                 "Permission denied",
-                str(exc),
+                message,
                 "Try running with sudo or check file permissions",
             )
         if isinstance(exc, SecretsDetectedError):
             return cls(
                 ErrorCategory.SECRETS,
                 "Secrets detected",
-                str(exc),
+                message,
                 "Use 'dot-man audit' to review secrets, or add them to the ignore list",
             )
         if isinstance(exc, GitOperationError):
-            msg = str(exc).lower()
-            if "conflict" in msg:
+            if "conflict" in lowered:
                 return cls(
                     ErrorCategory.GIT_CONFLICT,
                     "Git conflict detected",
-                    str(exc),
+                    message,
                     "Resolve conflicts in ~/.config/dot-man/repo, then retry",
                 )
             return cls(
                 ErrorCategory.UNKNOWN,
                 "Git operation failed",
-                str(exc),
+                message,
                 "Check git status in ~/.config/dot-man/repo",
             )
         if isinstance(exc, ConfigurationError):
             return cls(
                 ErrorCategory.CONFIG,
                 "Configuration error",
-                str(exc),
+                message,
                 "Run 'dot-man edit' to fix configuration issues",
             )
         if isinstance(exc, DiskSpaceError):
             return cls(
                 ErrorCategory.DISK,
                 "Disk space issue",
-                str(exc),
+                message,
                 "Free up disk space and retry",
             )
-        if "command not found" in str(exc).lower() or isinstance(
-            exc, FileNotFoundError
-        ):
+        if "command not found" in lowered or isinstance(exc, FileNotFoundError):
             return cls(
                 ErrorCategory.COMMAND,
                 "Command not found",
-                str(exc),
+                message,
                 "Check that the required program is installed and in PATH",
             )
 
@@ -118,7 +119,7 @@ class ErrorDiagnostic:
         return cls(
             ErrorCategory.UNKNOWN,
             "Unexpected error",
-            str(exc),
+            message,
             "Check logs or run with --verbose for details",
         )
 
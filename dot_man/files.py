@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import hashlib
 import logging
 import os
+import re
 import shutil
+import stat
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator, TextIO
 
 from .secrets import (
     SecretMatch,
@@ -15,6 +22,7 @@ from .secrets import (
 from .utils import sha256_hex
 
 __all__ = [
+    "atomic_open",
     "atomic_write_text",
     "smart_save_file",
     "copy_file",
@@ -51,21 +59,45 @@ def _get_redact_guard():
     return PermanentRedactGuard()
 
 
-def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
-    """Write content to a file atomically using a temporary file.
-
-    Ensures line endings are preserved exactly as in content (using newline="").
+@contextmanager
+def atomic_open(
+    path: Path, encoding: str = "utf-8", buffering: int = -1, fsync: bool = False
+) -> Iterator[TextIO]:
+    """Open a text stream whose contents atomically replace path on success.
+
+    Writers can stream straight into the returned handle instead of building
+    the whole content in memory first. Line endings are written exactly as
+    given (newline=""). If the block raises, path is left untouched.
+    ``buffering`` is passed to open(); a buffer larger than the content
+    turns many small writes into one write() at close. With ``fsync`` the
+    temp file is flushed to disk (one fsync) before it replaces path, so
+    the new contents survive a crash as well as an interrupted write. An
+    existing target's permission bits carry over to the new file.
     """
     # Create temp file in same directory to ensure atomic rename
     temp_path = path.with_suffix(f"{path.suffix}.tmp")
 
     try:
-        with temp_path.open("w", encoding=encoding, newline="") as f:
-            f.write(content)
+        mode: int | None = stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        mode = None
+
+    try:
+        with temp_path.open(
+            "w", buffering=buffering, encoding=encoding, newline=""
+        ) as f:
+            if mode is not None:
+                # The replacement keeps the target's permissions (e.g. a
+                # 0600 config holding credentials), set before any data
+                os.chmod(temp_path, mode)
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename
         os.replace(temp_path, path)
-    except OSError:
+    except BaseException:
         if temp_path.exists():
             try:
                 os.remove(temp_path)
@@ -74,11 +106,47 @@ def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None
         raise
 
 
+def atomic_write_text(path: Path, content: str, encoding: str = "utf-8") -> None:
+    """Write content to a file atomically using a temporary file.
+
+    Ensures line endings are preserved exactly as in content (using newline="").
+    """
+    _metadata_cache.pop(str(path), None)
+    with atomic_open(path, encoding) as f:
+        f.write(content)
+
+
+# Bytes read per step when comparing content against a file on disk
+_COMPARE_CHUNK_SIZE = 64 * 1024
+
+
+def _content_matches_file(data: bytes, path: Path, size: int) -> bool:
+    """Check whether the file at path holds exactly data.
+
+    A size mismatch (from an existing stat) answers without opening the
+    file; otherwise it is read in fixed-size chunks and the comparison
+    stops at the first differing chunk, so the file is never held in
+    memory as a whole.
+    """
+    if size != len(data):
+        return False
+    view = memoryview(data)
+    offset = 0
+    with path.open("rb") as f:
+        while chunk := f.read(_COMPARE_CHUNK_SIZE):
+            end = offset + len(chunk)
+            if view[offset:end] != chunk:
+                return False
+            offset = end
+    return offset == len(data)
+
+
 def smart_save_file(
     src_path: Path,
     dest_path: Path,
     secret_handler: Callable[[SecretMatch], str] | None = None,
     check_secrets: bool = True,
+    src_stat: os.stat_result | None = None,
 ) -> tuple[bool, list[SecretMatch]]:
     """Smartly save a file from source to destination.
 
@@ -87,12 +155,20 @@ def smart_save_file(
     3. Compares result with destination.
     4. Atomically writes if different.
 
+    Callers that already hold the source's stat (e.g. from a directory
+    scan) can pass it as ``src_stat`` so the source is not stat'ed again.
+
     Returns:
         tuple(saved: bool, secrets: list[SecretMatch])
     """
     detected_secrets: list[SecretMatch] = []
 
-    if not src_path.is_file():
+    if src_stat is None:
+        try:
+            src_stat = src_path.stat()
+        except OSError:
+            return False, []
+    if not stat.S_ISREG(src_stat.st_mode):
         return False, []
 
     # 1. Read source
@@ -132,23 +208,27 @@ def smart_save_file(
         )
 
     # 3. Compare with destination
+    final_bytes = final_content.encode("utf-8")
+    final_digest = _content_digest(final_bytes)
     should_save = True
     if dest_path.is_file():
         try:
             # Check permissions first
-            src_stat = src_path.stat()
             dest_stat = dest_path.stat()
             if src_stat.st_mode != dest_stat.st_mode:
                 should_save = True
+            elif _cached_digest(dest_path, dest_stat) == final_digest:
+                # Unchanged since we last verified it: skip the read
+                should_save = False
             else:
-                # Compare content
-                with dest_path.open("r", encoding="utf-8", newline="") as f:
-                    dest_content = f.read()
-
-                if final_content == dest_content:
-                    should_save = False
+                # Compare the bytes that would be written with those on disk
+                should_save = not _content_matches_file(
+                    final_bytes, dest_path, dest_stat.st_size
+                )
+                if not should_save:
+                    _remember_digest(dest_path, dest_stat, final_digest)
 
-        except (UnicodeDecodeError, OSError):
+        except OSError:
             should_save = True  # Assume changed if can't read dest
 
     # 4. Atomic Write if needed
@@ -157,10 +237,14 @@ def smart_save_file(
         atomic_write_text(dest_path, final_content)
         # Copy permissions
         try:
-            dest_path.chmod(src_path.stat().st_mode)
+            dest_path.chmod(src_stat.st_mode)
         except OSError:
             pass
 
+    if final_content is src_content:
+        # Nothing was redacted, so the source holds the same bytes
+        _remember_digest(src_path, src_stat, final_digest)
+
     return should_save, detected_secrets
 
 
@@ -177,6 +261,7 @@ def _handle_binary_copy(
             return False, []
 
     ensure_directory(dest_path.parent)
+    _metadata_cache.pop(str(dest_path), None)
     # shutil.copy2 copies data and metadata (permissions)
     # For binary, we can copy to temp then move to ensure atomicity
     temp_path = dest_path.with_suffix(f"{dest_path.suffix}.tmp")
@@ -195,10 +280,60 @@ def ensure_directory(path: Path, mode: int = 0o755) -> None:
     path.chmod(mode)
 
 
+# Opt-in stat-only comparison: equal size + equal st_mtime_ns is treated as
+# identical without reading file contents (set DOT_MAN_FAST_COMPARE=1).
+_FAST_COMPARE = os.environ.get("DOT_MAN_FAST_COMPARE") == "1"
+
 # Cache for file comparisons: { "path1|path2": (mtime1, size1, mtime2, size2, result) }
 _comparison_cache: dict[str, tuple[float, int, float, int, bool]] = {}
 
 
+# Content digests of files dot-man read or verified:
+# { path: (st_ino, st_ctime_ns, st_mtime_ns, st_size, digest) }. An entry is
+# only trusted while all four stat fields still match; ctime cannot be set
+# back by tools that preserve mtime (cp -p, rsync).
+_metadata_cache: dict[str, tuple[int, int, int, int, bytes]] = {}
+
+# Files changed this recently are not cached: another write within the same
+# timestamp tick would leave their stat unchanged (git's "racy" check).
+# Two seconds also covers coarse filesystems such as FAT.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Digest used to recognise unchanged file contents."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _cached_digest(path: Path, st: os.stat_result) -> bytes | None:
+    """Return the cached digest of path if its stat still matches."""
+    entry = _metadata_cache.get(str(path))
+    if entry is not None and entry[:4] == (
+        st.st_ino,
+        st.st_ctime_ns,
+        st.st_mtime_ns,
+        st.st_size,
+    ):
+        return entry[4]
+    return None
+
+
+def _remember_digest(path: Path, st: os.stat_result, digest: bytes) -> None:
+    """Record the digest of path's contents as of stat st.
+
+    Skipped while the file is still inside the racy window.
+    """
+    if time.time_ns() - st.st_ctime_ns < _RACY_WINDOW_NS:
+        return
+    _metadata_cache[str(path)] = (
+        st.st_ino,
+        st.st_ctime_ns,
+        st.st_mtime_ns,
+        st.st_size,
+        digest,
+    )
+
+
 def clear_comparison_cache() -> None:
     """Clear the file comparison cache.
 
@@ -207,6 +342,7 @@ def clear_comparison_cache() -> None:
     long-running processes like the TUI.
     """
     _comparison_cache.clear()
+    _metadata_cache.clear()
 
 
 def copy_file(
@@ -228,21 +364,81 @@ def copy_file(
     return saved, secrets
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob_set(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one alternation, with fnmatch's case handling.
+
+    A single regex tests every pattern in one scan of the path instead of
+    one match per pattern. Returns None for an empty pattern list.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+            for pattern in patterns
+        )
+    )
+
+
+def _compile_patterns(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns for repeated use with _matches_compiled."""
+    return _compile_glob_set(tuple(patterns))
+
+
+def _matches_compiled(path: Path, compiled: re.Pattern[str] | None) -> bool:
+    """Check a path against patterns from _compile_patterns."""
+    if compiled is None:
+        return False
+    # Match against filename, then relative path
+    return bool(
+        compiled.match(os.path.normcase(path.name))
+        or compiled.match(os.path.normcase(str(path)))
+    )
+
+
 def matches_patterns(path: Path, patterns: list[str]) -> bool:
     """Check if a path matches any of the given glob patterns."""
-    from fnmatch import fnmatch
+    return _matches_compiled(path, _compile_patterns(patterns))
 
-    name = path.name
-    rel_str = str(path)
 
-    for pattern in patterns:
-        # Match against filename
-        if fnmatch(name, pattern):
-            return True
-        # Match against relative path
-        if fnmatch(rel_str, pattern):
-            return True
-    return False
+def _scan_files(
+    root: Path | str,
+    relative: Path,
+    excludes: re.Pattern[str] | None,
+    follow_symlinks: bool = False,
+) -> Iterator[tuple[os.DirEntry[str], Path]]:
+    """Yield (entry, path relative to the walk root) for non-directories.
+
+    Walks top-down like os.walk: a directory's files come before its
+    subdirectories, directories matching ``excludes`` are pruned, and
+    symlinked directories are only descended into with ``follow_symlinks``.
+    Unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if follow_symlinks or not entry.is_symlink():
+                subdirs.append(entry)
+        else:
+            yield entry, relative / entry.name
+
+    for entry in subdirs:
+        d_rel = relative / entry.name
+        # Prune ignored directories to avoid traversing them
+        if excludes and _matches_compiled(d_rel, excludes):
+            continue
+        yield from _scan_files(entry.path, d_rel, excludes, follow_symlinks)
 
 
 def copy_directory(
@@ -268,74 +464,50 @@ def copy_directory(
     Returns:
         Tuple of (files_copied, files_failed, detected_secrets)
     """
-    include_patterns = include_patterns or []
-    exclude_patterns = exclude_patterns or []
+    # Compile once per call rather than per visited path
+    includes = _compile_patterns(include_patterns or [])
+    excludes = _compile_patterns(exclude_patterns or [])
     files_copied = 0
     files_failed = 0
     all_secrets: list[SecretMatch] = []
 
-    # Use os.walk for better performance and control over directory recursion
-    for root, dirs, files in os.walk(source, topdown=True, followlinks=follow_symlinks):
-        root_path = Path(root)
-
-        # Prune ignored directories in-place to avoid traversing them
-        if exclude_patterns:
-            # We need to calculate relative path for each dir to check against patterns
-            # Note: dirs[:] = [d for d in dirs if not matches_patterns...]
-            # The check needs to be efficient.
-
-            # Since matches_patterns expects a Path relative to source, we construct it.
-            # root_rel is the relative path of current directory from source.
-            try:
-                root_rel = root_path.relative_to(source)
-            except ValueError:
-                # Should not happen as we walk source
-                continue
-
-            # Iterate backwards to safely remove items
-            for i in range(len(dirs) - 1, -1, -1):
-                d_name = dirs[i]
-                d_rel = root_rel / d_name
-
-                # Check if this directory should be excluded
-                if matches_patterns(d_rel, exclude_patterns):
-                    del dirs[i]
-                    continue
-
-        # Process files
-        for filename in files:
-            src_file = root_path / filename
-
-            # Calculate relative path from source root
-            try:
-                relative = src_file.relative_to(source)
-            except ValueError:
-                continue
+    # DirEntry caches the file type from the directory listing and its own
+    # stat() result, so classifying and copying a file stats it at most once
+    for entry, relative in _scan_files(
+        source, Path(), excludes, follow_symlinks=follow_symlinks
+    ):
+        # Check exclude patterns
+        if excludes and _matches_compiled(relative, excludes):
+            continue
 
-            # Check exclude patterns
-            if exclude_patterns and matches_patterns(relative, exclude_patterns):
-                continue
+        # Check include patterns (if specified, file must match at least one)
+        if includes and not _matches_compiled(relative, includes):
+            continue
 
-            # Check include patterns (if specified, file must match at least one)
-            if include_patterns and not matches_patterns(relative, include_patterns):
-                continue
+        src_file = source / relative
+        dest_path = destination / relative
 
-            dest_path = destination / relative
+        try:
+            src_stat = entry.stat()
+        except OSError:
+            # e.g. a dangling symlink: not a file to copy
+            continue
 
-            try:
-                # Use smart_save_file for single pass, robust saving
-                saved, secrets = smart_save_file(
-                    src_file,
-                    dest_path,
-                    secret_handler=secret_handler,
-                    check_secrets=filter_secrets_enabled,
-                )
-                all_secrets.extend(secrets)
-                if saved:
-                    files_copied += 1
-            except Exception as e:
-                logging.warning("Failed to copy file %s: %s", src_file, e)
-                files_failed += 1
+        try:
+            # Use smart_save_file for single pass, robust saving
+            saved, secrets = smart_save_file(
+                src_file,
+                dest_path,
+                secret_handler=secret_handler,
+                check_secrets=filter_secrets_enabled,
+                src_stat=src_stat,
+            )
+            all_secrets.extend(secrets)
+            if saved:
+                files_copied += 1
+        except Exception as e:
+            logging.warning("Failed to copy file %s: %s", src_file, e)
+            files_failed += 1
 
     return files_copied, files_failed, all_secrets
 
@@ -370,6 +542,10 @@ def compare_files(file1: Path, file2: Path) -> bool:
         if stat1.st_size != stat2.st_size:
             return False
 
+        # Same size and same nanosecond mtime: skip reading both files
+        if _FAST_COMPARE and stat1.st_mtime_ns == stat2.st_mtime_ns:
+            return True
+
         # Check comparison cache
         # Key combining both paths ensures uniqueness for the pair
         cache_key = f"{file1}|{file2}"
@@ -384,6 +560,13 @@ def compare_files(file1: Path, file2: Path) -> bool:
             ):
                 return res
 
+        # Both files unchanged since their contents were last seen
+        digest1 = _cached_digest(file1, stat1)
+        if digest1 is not None:
+            digest2 = _cached_digest(file2, stat2)
+            if digest2 is not None:
+                return digest1 == digest2
+
         # Efficient chunked comparison
         import filecmp
 
@@ -506,8 +689,8 @@ def deploy_directory_with_symlinks(
     Returns:
         Tuple of (files_symlinked, files_failed)
     """
-    include_patterns = include_patterns or []
-    exclude_patterns = exclude_patterns or []
+    includes = _compile_patterns(include_patterns or [])
+    excludes = _compile_patterns(exclude_patterns or [])
     symlinked = 0
     failed = 0
 
@@ -515,7 +698,7 @@ def deploy_directory_with_symlinks(
         root_path = Path(root)
 
         # Prune excluded directories
-        if exclude_patterns:
+        if excludes:
             try:
                 root_rel = root_path.relative_to(source)
             except ValueError:
@@ -524,7 +707,7 @@ def deploy_directory_with_symlinks(
             for i in range(len(dirs) - 1, -1, -1):
                 d_name = dirs[i]
                 d_rel = root_rel / d_name
-                if matches_patterns(d_rel, exclude_patterns):
+                if _matches_compiled(d_rel, excludes):
                     del dirs[i]
 
         for filename in files:
@@ -534,9 +717,9 @@ def deploy_directory_with_symlinks(
             except ValueError:
                 continue
 
-            if exclude_patterns and matches_patterns(relative, exclude_patterns):
+            if excludes and _matches_compiled(relative, excludes):
                 continue
-            if include_patterns and not matches_patterns(relative, include_patterns):
+            if includes and not _matches_compiled(relative, includes):
                 continue
 
             dest_path = destination / relative
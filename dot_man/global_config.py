@@ -3,35 +3,74 @@
 __all__ = [
     "GlobalConfig",
     "load_config_file",
+    "load_config_data",
+    "load_config_doc",
+    "config_file_stamp",
     "write_config_file",
+    "config_fingerprint",
+    "changed_config_keys",
     "_write_toml",
     "substitute_templates",
 ]
 
+import copy
+import json
 import logging
+import mmap
 import os
-import platform
-import socket
+import pickle
+import re
+import struct
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Iterable, Optional, cast
+
+# socket and platform are imported on first use: together they cost a few
+# milliseconds at startup, and most commands never render a template
+
+
+def _hostname() -> str:
+    import socket
+
+    return socket.gethostname()
+
+
+def _fqdn() -> str:
+    import socket
+
+    return socket.getfqdn()
+
+
+def _platform_info(attr: str) -> str:
+    import platform
+
+    return cast(str, getattr(platform, attr)())
+
 
 # System variables that can be auto-detected
 SYSTEM_VARS = {
-    "HOSTNAME": lambda: socket.gethostname(),
+    "HOSTNAME": _hostname,
     "USER": lambda: os.environ.get("USER", os.environ.get("USERNAME", "unknown")),
     "HOME": lambda: str(Path.home()),
-    "OS": lambda: platform.system(),
-    "OS_VERSION": lambda: platform.version(),
-    "ARCH": lambda: platform.machine(),
+    "OS": lambda: _platform_info("system"),
+    "OS_VERSION": lambda: _platform_info("version"),
+    "ARCH": lambda: _platform_info("machine"),
     "SHELL": lambda: os.environ.get("SHELL", "/bin/sh"),
     "EDITOR": lambda: os.environ.get("EDITOR", os.environ.get("VISUAL", "vim")),
     "EMAIL": lambda: None,
-    "DOMAIN": lambda: socket.getfqdn(),
+    "DOMAIN": _fqdn,
 }
 
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+_CONDITIONAL_RE = re.compile(
+    r'\{\{\s*if\s+(\w+)\s*(==|!=)\s*"([^"]*)"\s*\}\}(.*?)\{\{\s*endif\s*\}\}',
+    re.DOTALL,
+)
+
+
 def substitute_templates(text: str, user_templates: dict | None = None) -> str:
     """Substitute template variables in a string.
 
@@ -47,7 +86,8 @@ def substitute_templates(text: str, user_templates: dict | None = None) -> str:
     Returns:
         String with all substitutions applied
     """
-    if not text:
+    # Nothing to substitute: skip probing the system variables entirely
+    if not text or "{{" not in text:
         return text
 
     result = text
@@ -68,22 +108,13 @@ def substitute_templates(text: str, user_templates: dict | None = None) -> str:
     # Process conditionals first
     result = _process_conditionals(result, vars_dict)
 
-    # Then replace simple {{VAR}} placeholders
-    for var_name, val in vars_dict.items():
-        placeholder = f"{{{{{var_name}}}}}"
-        result = result.replace(placeholder, val)
-
-    return result
+    # Then replace simple {{VAR}} placeholders in one pass; unknown names are
+    # left untouched
+    return _PLACEHOLDER_RE.sub(lambda m: vars_dict.get(m.group(1), m.group(0)), result)
 
 
 def _process_conditionals(text: str, vars_dict: dict[str, str]) -> str:
     """Process {{ if VAR == "value" }}...{{ endif }} conditionals."""
-    import re
-
-    pattern = re.compile(
-        r'\{\{\s*if\s+(\w+)\s*(==|!=)\s*"([^"]*)"\s*\}\}(.*?)\{\{\s*endif\s*\}\}',
-        re.DOTALL,
-    )
 
     def _eval_conditional(match: re.Match[str]) -> str:
         var_name = str(match.group(1))
@@ -98,19 +129,8 @@ def _process_conditionals(text: str, vars_dict: dict[str, str]) -> str:
             return body
         return ""
 
-    return pattern.sub(_eval_conditional, text)
-
-
-# Python 3.11+ has tomllib built-in, otherwise use tomli
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        raise ImportError("Please install tomli: pip install tomli")
+    return _CONDITIONAL_RE.sub(_eval_conditional, text)
 
-import tomlkit
 
 from .constants import (
     DEFAULT_BRANCH,
@@ -120,89 +140,376 @@ from .constants import (
 from .exceptions import ConfigurationError
 
 
-def update_config_doc(doc: Any, data: dict) -> None:
+def _get_tomllib() -> Any:
+    """Return the TOML parser module, importing it on first use.
+
+    Deferred so commands that never read config (``--help``, ``--version``)
+    skip the import cost.
+    """
+    # Python 3.11+ has tomllib built-in, otherwise use tomli
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError("Please install tomli: pip install tomli")
+    return tomllib
+
+
+_MISSING = object()
+
+
+def update_config_doc(
+    doc: Any, data: dict, keys: Optional[Iterable[str]] = None
+) -> None:
     """Recursively update a tomlkit/ruamel.yaml config document (doc) with dict data,
     preserving comments and deleting stale keys.
+
+    If keys is given, only those top-level keys of data are merged into the
+    document; the caller vouches that every other key is already in sync.
+    Stale keys are removed either way.
     """
     # Remove keys in doc that are not in data
     keys_to_remove = [k for k in doc if k not in data]
     for k in keys_to_remove:
         del doc[k]
 
-    # Update or add keys from data
-    for k, v in data.items():
-        if k in doc:
-            if isinstance(v, dict) and isinstance(doc[k], dict):
-                update_config_doc(doc[k], v)
-            elif doc[k] == v:
-                # Avoid re-assignment to preserve comments/formatting
-                pass
-            else:
-                doc[k] = v
-        else:
+    # Update or add keys from data. Each doc key is looked up once: container
+    # item access is comparatively expensive in tomlkit.
+    items = data.items() if keys is None else ((k, data[k]) for k in keys)
+    for k, v in items:
+        current = doc.get(k, _MISSING)
+        if current is _MISSING:
+            doc[k] = v
+        elif isinstance(v, dict) and isinstance(current, dict):
+            update_config_doc(current, v)
+        elif current != v:
+            # Equal values are left alone to preserve comments/formatting
             doc[k] = v
 
 
-def load_config_file(path: Path, label: str = "Config") -> tuple[dict, Any]:
-    """Load a TOML/YAML configuration file.
+# Identity of a file's contents as far as stat can tell:
+# (st_ino, st_ctime_ns, st_mtime_ns, st_size)
+_StatKey = tuple[int, int, int, int]
+
+# Parsed config data keyed by path: (stat key, data)
+_CONFIG_CACHE: dict[Path, tuple[_StatKey, dict]] = {}
+
+# Comment-preserving documents keyed by path: (stat key, doc snapshot); see
+# _snapshot_doc for the snapshot form
+_DOC_CACHE: dict[Path, tuple[_StatKey, Any]] = {}
+
+# On-disk cache header: the source's stat key and the pickled payload length
+_DISK_CACHE_HEADER = struct.Struct("<QQQQQ")
+
+# Files changed this recently are not cached: a rewrite within the same
+# timestamp tick could leave their stat unchanged (git's "racy" check, as
+# for the file digests in files.py)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _stat_key(st: os.stat_result) -> Optional[_StatKey]:
+    """Return the cache key for a file's stat, or None if it is too recent.
+
+    ctime is included because it moves on every write and cannot be set
+    back, unlike mtime (git checkout, cp -p and rsync all set mtimes).
+    """
+    if time.time_ns() - st.st_ctime_ns < _RACY_WINDOW_NS:
+        return None
+    return st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size
+
+
+def _snapshot_doc(doc: Any) -> Any:
+    """Return a private snapshot of a parsed document for _DOC_CACHE.
+
+    Documents are held pickled: unpickling a fresh copy on a cache hit is
+    several times cheaper than deep-copying a tomlkit document. Anything
+    that cannot be pickled is kept as a deep copy instead.
+    """
+    try:
+        return pickle.dumps(doc, protocol=5)
+    except Exception:
+        return copy.deepcopy(doc)
+
+
+def _restore_doc(snapshot: Any) -> Any:
+    """Return a caller-owned copy of a document from _snapshot_doc."""
+    if isinstance(snapshot, bytes):
+        return pickle.loads(snapshot)
+    return copy.deepcopy(snapshot)
+
+
+# Files at least this large are decoded straight from a read-only mapping
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_config_text(path: Path, size: int) -> str:
+    """Read a UTF-8 config file, mapping large files instead of reading them.
+
+    Decoding from the mapping skips the intermediate bytes copy that
+    read_bytes() makes, and sequential-access advice lets the kernel read
+    ahead in parse order.
+    """
+    if size < _MMAP_THRESHOLD:
+        return path.read_bytes().decode("utf-8")
+    with (
+        open(path, "rb") as fh,
+        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        if hasattr(mm, "madvise"):  # Not available on Windows
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.madvise(mmap.MADV_WILLNEED)
+        return str(mm, "utf-8")
+
+
+def _read_disk_cache(cache_path: Path, key: _StatKey) -> Optional[dict]:
+    """Return the pickled data in cache_path if it matches key, else None."""
+    try:
+        with open(cache_path, "rb") as fh:
+            header = fh.read(_DISK_CACHE_HEADER.size)
+            *cached_key, payload_len = _DISK_CACHE_HEADER.unpack(header)
+            if tuple(cached_key) != key:
+                return None
+            data = pickle.loads(fh.read(payload_len))
+    except Exception:
+        # Missing, truncated or unreadable (e.g. written by another library
+        # version) caches are simply rebuilt
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_disk_cache(cache_path: Path, key: _StatKey, data: dict) -> None:
+    """Atomically store the parsed data for the file identified by key."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        payload = pickle.dumps(data, protocol=5)
+        with open(tmp_path, "wb") as fh:
+            fh.write(_DISK_CACHE_HEADER.pack(*key, len(payload)))
+            fh.write(payload)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        # The cache is an optimization only; never fail a load over it
+        logging.debug(f"Could not write config cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _stat_config(path: Path, label: str) -> os.stat_result:
+    """Stat a config file, reporting only a genuinely missing one as not found."""
+    try:
+        return path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise ConfigurationError(f"{label} not found: {path}")
+
+
+def _is_yaml(path: Path) -> bool:
+    return path.suffix in (".yaml", ".yml")
+
+
+def load_config_data(
+    path: Path, label: str = "Config", cache_path: Optional[Path] = None
+) -> dict:
+    """Load the plain data of a TOML/YAML configuration file.
+
+    Reads use the fast plain parsers (tomllib, PyYAML's safe_load); the
+    comment-preserving document is only needed to save and is loaded
+    separately with load_config_doc.
+
+    Parsed results are memoized per process by path, mtime and size, so a
+    repeat load of an unchanged file is a stat plus a copy. Callers always
+    receive private copies and may mutate them freely.
+
+    When cache_path is given, the parsed data is also pickled there, so
+    later CLI invocations skip parsing entirely while the file's inode,
+    ctime, mtime and size are unchanged. Files changed within the last
+    _RACY_WINDOW_NS are always parsed and never cached.
 
     Args:
         path: Path to the config file.
         label: Label for error messages (e.g. "Global config", "dot-man config").
-
-    Returns:
-        (data_dict, doc_for_preserving_comments)
+        cache_path: Optional on-disk cache file for the parsed data.
     """
-    if not path.exists():
-        raise ConfigurationError(f"{label} not found: {path}")
+    # A single stat serves as both the existence check and the cache key
+    st = _stat_config(path, label)
+    key = _stat_key(st)
+
+    cached = _CONFIG_CACHE.get(path)
+    if key is not None and cached and cached[0] == key:
+        return copy.deepcopy(cached[1])
+
+    data = None
+    if key is not None and cache_path is not None:
+        data = _read_disk_cache(cache_path, key)
+    if data is None:
+        # TOML is UTF-8 by spec; decode the bytes once ourselves rather than
+        # via a locale-dependent text wrapper
+        content = _read_config_text(path, st.st_size)
+        if _is_yaml(path):
+            try:
+                import yaml as pyyaml  # type: ignore[import-untyped]
+            except ImportError:
+                raise ConfigurationError(
+                    "YAML support requires PyYAML. Install with: pip install dotman-git[yaml]"
+                )
+            # libyaml's C loader when PyYAML was built with it; same safe
+            # subset, without the pure-Python scanner
+            loader = getattr(pyyaml, "CSafeLoader", pyyaml.SafeLoader)
+            data = pyyaml.load(content, Loader=loader) or {}
+        else:
+            data = _get_tomllib().loads(content)
+        if key is not None and cache_path is not None:
+            _write_disk_cache(cache_path, key, data)
+
+    if key is None:
+        return data
+    _CONFIG_CACHE[path] = (key, data)
+    return copy.deepcopy(data)
 
-    content = path.read_text()
 
-    if path.suffix in (".yaml", ".yml"):
+def load_config_doc(path: Path, label: str = "Config", missing_ok: bool = False) -> Any:
+    """Load the comment-preserving tomlkit/ruamel.yaml document of a config file.
+
+    Documents are memoized like load_config_data; each call returns a
+    document the caller owns. With missing_ok, a missing file yields None.
+    """
+    try:
+        st = _stat_config(path, label)
+    except ConfigurationError:
+        if missing_ok:
+            return None
+        raise
+
+    key = _stat_key(st)
+    cached = _DOC_CACHE.get(path)
+    if key is not None and cached and cached[0] == key:
+        return _restore_doc(cached[1])
+
+    content = _read_config_text(path, st.st_size)
+    if _is_yaml(path):
         try:
             from ruamel.yaml import YAML
         except ImportError:
             raise ConfigurationError(
                 "YAML support requires ruamel.yaml. Install with: pip install dotman-git[yaml]"
             )
-        yaml = YAML()
-        doc = yaml.load(content)
-        import yaml as pyyaml  # type: ignore[import-untyped]
-
-        data = pyyaml.safe_load(content) or {}
+        doc = YAML().load(content)
     else:
-        data = tomllib.loads(content)
+        import tomlkit
+
         doc = tomlkit.parse(content)
 
-    return data, doc
+    if key is not None:
+        # The cache keeps only a snapshot, so this document can be handed out
+        _DOC_CACHE[path] = (key, _snapshot_doc(doc))
+    return doc
+
+
+def config_file_stamp(path: Path) -> Optional[_StatKey]:
+    """Return the stat key of a config file, or None if missing or too recent.
+
+    The config classes record this when they load, and compare it when
+    save() parses the deferred document, to tell whether that document was
+    read from the same file contents as their data. None never vouches
+    for that.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return _stat_key(st)
+
+
+def load_config_file(
+    path: Path, label: str = "Config", cache_path: Optional[Path] = None
+) -> tuple[dict, Any]:
+    """Load a TOML/YAML configuration file's data and document together.
+
+    Args:
+        path: Path to the config file.
+        label: Label for error messages (e.g. "Global config", "dot-man config").
+        cache_path: Optional on-disk cache file for the parsed data.
+
+    Returns:
+        (data_dict, doc_for_preserving_comments)
+    """
+    return load_config_data(path, label, cache_path), load_config_doc(path, label)
 
 
-def write_config_file(path: Path, data: dict, preserve_doc: Any = None) -> None:
+# Larger than any realistic config, so a save (data plus footer, or the many
+# small writes ruamel makes) reaches the file as a single write() call
+_CONFIG_WRITE_BUFFER = 128 * 1024
+
+
+def write_config_file(
+    path: Path,
+    data: dict,
+    preserve_doc: Any = None,
+    footer: str = "",
+    changed_keys: Optional[Iterable[str]] = None,
+) -> None:
     """Write TOML/YAML configuration data to file, preserving comments when possible.
 
+    The document is serialized straight into a temporary file that then
+    atomically replaces the target, so a crash mid-write never leaves a
+    truncated config behind. The temp file is fsynced once, just before the
+    rename.
+
     Args:
         path: File path to write to
         data: Dictionary of data to write
         preserve_doc: Optional existing TOML/YAML document to update (preserves comments)
+        footer: Optional text (e.g. commented examples) appended after the data
+        changed_keys: Optional top-level keys that differ from preserve_doc;
+            when given, unchanged tables are not walked
     """
-    if path.suffix in (".yaml", ".yml"):
-        from ruamel.yaml import YAML
-
-        yaml = YAML()
-        if preserve_doc is not None:
-            update_config_doc(preserve_doc, data)
-            with open(path, "w") as f:
-                yaml.dump(preserve_doc, f)
-        else:
-            with open(path, "w") as f:
-                yaml.dump(data, f)
-    else:
-        # TOML
-        if preserve_doc is not None:
-            update_config_doc(preserve_doc, data)
-            path.write_text(tomlkit.dumps(preserve_doc))
+    # The read caches are not seeded: the new file is inside the racy window
+    _CONFIG_CACHE.pop(path, None)
+    _DOC_CACHE.pop(path, None)
+
+    if preserve_doc is not None:
+        update_config_doc(preserve_doc, data, changed_keys)
+        data = preserve_doc
+
+    from .files import atomic_open
+
+    # Replace the link target rather than the link for symlinked configs
+    target = path.resolve() if path.is_symlink() else path
+    # Serialize straight into the temp file; its buffered writer encodes in
+    # chunks, so no full-size intermediate str/bytes copy is kept around
+    with atomic_open(target, buffering=_CONFIG_WRITE_BUFFER, fsync=True) as fh:
+        if path.suffix in (".yaml", ".yml"):
+            from ruamel.yaml import YAML
+
+            YAML().dump(data, fh)
         else:
-            path.write_text(tomlkit.dumps(data))
+            # TOML
+            import tomlkit
+
+            tomlkit.dump(data, fh)
+        fh.write(footer)
+
+
+def config_fingerprint(data: dict) -> dict[str, int]:
+    """Return cheap in-process fingerprints of each top-level config key.
+
+    Used by the config classes to skip rewriting a file whose data has not
+    changed since it was last loaded or saved, and to limit comment-preserving
+    updates to the tables that did change. Catches changes made directly to
+    ``_data`` as well as through setters.
+    """
+    return {
+        key: hash(json.dumps(value, sort_keys=True, default=str))
+        for key, value in data.items()
+    }
+
+
+def changed_config_keys(
+    fingerprint: dict[str, int], saved: Optional[dict[str, int]]
+) -> Optional[list[str]]:
+    """Return the keys whose fingerprint differs from saved (None: all of them)."""
+    if saved is None:
+        return None
+    return [key for key, value in fingerprint.items() if saved.get(key) != value]
 
 
 def _write_toml(path: Path, data: dict, preserve_doc: Any = None) -> None:
@@ -215,16 +522,35 @@ class GlobalConfig:
 
     def __init__(self):
         self._data: dict = {}
-        self._path = GLOBAL_TOML
+        self._path: Path = GLOBAL_TOML
         self._doc: Any = None  # For preserving comments
+        # True after load() until the document is first needed by save()
+        self._doc_deferred: bool = False
+        # config_file_stamp of the file self._data was loaded from
+        self._loaded_stamp: Optional[tuple[int, int, int, int]] = None
         self._dirty: bool = False
+        # Fingerprint of the data as last read from or written to disk
+        self._saved_hash: Optional[dict[str, int]] = None
+
+    @property
+    def _cache_path(self) -> Path:
+        """Sidecar file holding the parsed config between CLI invocations."""
+        return self._path.with_name(self._path.name + ".cache")
 
     def load(self) -> None:
         """Load the global configuration file.
 
         Supports TOML (.toml) and YAML (.yaml/.yml) formats.
         """
-        self._data, self._doc = load_config_file(self._path, label="Global config")
+        # Stamped before reading: a change in between then reads as a change
+        self._loaded_stamp = config_file_stamp(self._path)
+        self._data = load_config_data(
+            self._path, label="Global config", cache_path=self._cache_path
+        )
+        # The comment-preserving document is only parsed if we save
+        self._doc = None
+        self._doc_deferred = True
+        self._saved_hash = config_fingerprint(self._data)
         self._dirty = False
 
     def save(self, force: bool = True) -> None:
@@ -235,8 +561,30 @@ class GlobalConfig:
         """
         if not self._dirty and not force:
             return
+        fingerprint = config_fingerprint(self._data)
+        if fingerprint == self._saved_hash and self._path.exists():
+            # Nothing changed since the last load/save; skip the rewrite
+            self._dirty = False
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        write_config_file(self._path, self._data, self._doc)
+        changed_keys = changed_config_keys(fingerprint, self._saved_hash)
+        if self._doc_deferred:
+            self._doc = load_config_doc(self._path, missing_ok=True)
+            self._doc_deferred = False
+            stamp = config_file_stamp(self._path)
+            if stamp is None or stamp != self._loaded_stamp:
+                # The file changed after load() (or is too recent to tell),
+                # so the document may not hold our unchanged tables: merge
+                # every key
+                changed_keys = None
+        write_config_file(
+            self._path,
+            self._data,
+            self._doc,
+            changed_keys=changed_keys,
+        )
+        self._cache_path.unlink(missing_ok=True)
+        self._saved_hash = fingerprint
         self._dirty = False
 
     def create_default(self) -> None:
@@ -244,7 +592,11 @@ class GlobalConfig:
         self._data = {
             "dot-man": {
                 "current_branch": DEFAULT_BRANCH,
-                "initialized_date": datetime.now().isoformat(),
+                # Same UTC, second-precision ISO stamp as datetime.isoformat,
+                # formatted in one C call without building a datetime
+                "initialized_date": time.strftime(
+                    "%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()
+                ),
                 "version": "1.0.0",
             },
             "remote": {
@@ -275,6 +627,14 @@ class GlobalConfig:
         self._dirty = True
         self.save(force=True)
 
+    def _set_value(self, table: str, key: str, value: Any) -> None:
+        """Set table.key, marking the config dirty only if the value changed."""
+        values = self._data.setdefault(table, {})
+        if key in values and values[key] == value:
+            return
+        values[key] = value
+        self._dirty = True
+
     @property
     def current_branch(self) -> str:
         """Get the current branch name."""
@@ -285,10 +645,7 @@ class GlobalConfig:
     @current_branch.setter
     def current_branch(self, value: str) -> None:
         """Set the current branch name."""
-        if "dot-man" not in self._data:
-            self._data["dot-man"] = {}
-        self._data["dot-man"]["current_branch"] = value
-        self._dirty = True
+        self._set_value("dot-man", "current_branch", value)
 
     @property
     def remote_url(self) -> str:
@@ -298,10 +655,7 @@ class GlobalConfig:
     @remote_url.setter
     def remote_url(self, value: str) -> None:
         """Set the remote URL."""
-        if "remote" not in self._data:
-            self._data["remote"] = {}
-        self._data["remote"]["url"] = value
-        self._dirty = True
+        self._set_value("remote", "url", value)
 
     @property
     def editor(self) -> Optional[str]:
@@ -311,10 +665,7 @@ class GlobalConfig:
     @editor.setter
     def editor(self, value: Optional[str]) -> None:
         """Set the editor."""
-        if "dot-man" not in self._data:
-            self._data["dot-man"] = {}
-        self._data["dot-man"]["editor"] = value
-        self._dirty = True
+        self._set_value("dot-man", "editor", value)
 
     @property
     def secrets_filter_enabled(self) -> bool:
@@ -324,10 +675,7 @@ class GlobalConfig:
     @secrets_filter_enabled.setter
     def secrets_filter_enabled(self, value: bool) -> None:
         """Set whether secrets filter is enabled by default."""
-        if "defaults" not in self._data:
-            self._data["defaults"] = {}
-        self._data["defaults"]["secrets_filter"] = value
-        self._dirty = True
+        self._set_value("defaults", "secrets_filter", value)
 
     @property
     def strict_mode(self) -> bool:
@@ -337,10 +685,7 @@ class GlobalConfig:
     @strict_mode.setter
     def strict_mode(self, value: bool) -> None:
         """Set whether strict mode is enabled."""
-        if "security" not in self._data:
-            self._data["security"] = {}
-        self._data["security"]["strict_mode"] = value
-        self._dirty = True
+        self._set_value("security", "strict_mode", value)
 
     def get_defaults(self) -> dict[str, Any]:
         """Get default settings that apply to all sections."""
@@ -369,10 +714,7 @@ class GlobalConfig:
             raise ConfigurationError(
                 "switch.default_behavior must be 'save' or 'no-save'"
             )
-        if "switch" not in self._data:
-            self._data["switch"] = {}
-        self._data["switch"]["default_behavior"] = value
-        self._dirty = True
+        self._set_value("switch", "default_behavior", value)
 
     def get_all_templates(self) -> dict[str, Any]:
         """Get all templates."""
@@ -391,7 +733,4 @@ class GlobalConfig:
     @current_profile.setter
     def current_profile(self, value: str) -> None:
         """Set the current profile."""
-        if "dot-man" not in self._data:
-            self._data["dot-man"] = {}
-        self._data["dot-man"]["current_profile"] = value
-        self._dirty = True
+        self._set_value("dot-man", "current_profile", value)
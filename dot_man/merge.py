@@ -333,6 +333,38 @@ HOOK_CATEGORIES = {
 }
 
 
+# Substring of a config name -> reload hook, checked in order (so "nvim"
+# wins over "vim"); built once rather than on every lookup
+_CONFIG_HOOKS: tuple[tuple[str, str | None], ...] = (
+    ("nvim", UNIVERSAL_HOOKS["nvim_sync"]),
+    ("vim", UNIVERSAL_HOOKS["vim_reload"]),
+    ("fish", UNIVERSAL_HOOKS["fish_reload"]),
+    ("bashrc", UNIVERSAL_HOOKS["bash_reload"]),
+    ("zshrc", UNIVERSAL_HOOKS["zsh_reload"]),
+    ("zsh", UNIVERSAL_HOOKS["zsh_reload"]),
+    ("tmux", UNIVERSAL_HOOKS["tmux_reload"]),
+    ("kitty", UNIVERSAL_HOOKS["kitty_reload"]),
+    ("alacritty", UNIVERSAL_HOOKS["alacritty_reload"]),
+    ("wezterm", UNIVERSAL_HOOKS["wezterm_reload"]),
+    ("hyprland", UNIVERSAL_HOOKS["hyprland_reload"]),
+    ("hypr", UNIVERSAL_HOOKS["hyprland_reload"]),
+    ("sway", UNIVERSAL_HOOKS["sway_reload"]),
+    ("i3", UNIVERSAL_HOOKS["i3_reload"]),
+    ("awesome", UNIVERSAL_HOOKS["awesome_reload"]),
+    ("polybar", UNIVERSAL_HOOKS["polybar_reload"]),
+    ("waybar", UNIVERSAL_HOOKS["waybar_reload"]),
+    ("starship", UNIVERSAL_HOOKS["starship_reload"]),
+    ("fzf", UNIVERSAL_HOOKS["fzf_reload"]),
+    ("emacs", UNIVERSAL_HOOKS["emacs_reload"]),
+    ("doom", UNIVERSAL_HOOKS["doom_reload"]),
+    ("xresources", UNIVERSAL_HOOKS["xreload"]),
+    ("ssh", UNIVERSAL_HOOKS["ssh_reload"]),
+    ("git", UNIVERSAL_HOOKS["git_reload"]),
+    ("quickshell", None),
+    ("qs", None),
+)
+
+
 def get_hook_for_config(config_name: str) -> str | None:
     """Get the appropriate reload hook for a config name.
 
@@ -344,36 +376,7 @@ def get_hook_for_config(config_name: str) -> str | None:
     """
     config_lower = config_name.lower()
 
-    hook_map = {
-        "nvim": UNIVERSAL_HOOKS["nvim_sync"],
-        "vim": UNIVERSAL_HOOKS["vim_reload"],
-        "fish": UNIVERSAL_HOOKS["fish_reload"],
-        "bashrc": UNIVERSAL_HOOKS["bash_reload"],
-        "zshrc": UNIVERSAL_HOOKS["zsh_reload"],
-        "zsh": UNIVERSAL_HOOKS["zsh_reload"],
-        "tmux": UNIVERSAL_HOOKS["tmux_reload"],
-        "kitty": UNIVERSAL_HOOKS["kitty_reload"],
-        "alacritty": UNIVERSAL_HOOKS["alacritty_reload"],
-        "wezterm": UNIVERSAL_HOOKS["wezterm_reload"],
-        "hyprland": UNIVERSAL_HOOKS["hyprland_reload"],
-        "hypr": UNIVERSAL_HOOKS["hyprland_reload"],
-        "sway": UNIVERSAL_HOOKS["sway_reload"],
-        "i3": UNIVERSAL_HOOKS["i3_reload"],
-        "awesome": UNIVERSAL_HOOKS["awesome_reload"],
-        "polybar": UNIVERSAL_HOOKS["polybar_reload"],
-        "waybar": UNIVERSAL_HOOKS["waybar_reload"],
-        "starship": UNIVERSAL_HOOKS["starship_reload"],
-        "fzf": UNIVERSAL_HOOKS["fzf_reload"],
-        "emacs": UNIVERSAL_HOOKS["emacs_reload"],
-        "doom": UNIVERSAL_HOOKS["doom_reload"],
-        "xresources": UNIVERSAL_HOOKS["xreload"],
-        "ssh": UNIVERSAL_HOOKS["ssh_reload"],
-        "git": UNIVERSAL_HOOKS["git_reload"],
-        "quickshell": None,
-        "qs": None,
-    }
-
-    for key, hook in hook_map.items():
+    for key, hook in _CONFIG_HOOKS:
         if key in config_lower:
             return hook
 
@@ -108,6 +108,10 @@ class DotManOperations(SaveDeployMixin, BranchMixin, StatusMixin):
         """Get a resolved section by name."""
         return self.dotman_config.get_section(name)
 
+    def get_all_sections(self) -> list[Section]:
+        """Get all resolved sections in current branch, in config order."""
+        return self.dotman_config.get_all_sections()
+
     def iter_section_paths(self, section: Section) -> Iterator[tuple[Path, Path, str]]:
         """
         Iterate over all paths in a section with their status.
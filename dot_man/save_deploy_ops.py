@@ -81,10 +81,7 @@ class SaveDeployMixin:
     def current_branch(self) -> str: ...
 
     @abstractmethod
-    def get_section(self, name: str) -> Any: ...
-
-    @abstractmethod
-    def get_sections(self) -> list[str]: ...
+    def get_all_sections(self) -> list[Any]: ...
 
     def _restore_file_secrets(
         self, dest_path: Path, original_path: str, branch: str
@@ -255,6 +252,8 @@ class SaveDeployMixin:
         all_secrets: list[SecretMatch] = []
         errors: list[str] = []
         symlink_paths: list[Path] = []
+        # Resolved once: the handler runs per secret, possibly from worker threads
+        branch = self.current_branch
 
         # Enhanced secret handler that also stashes to vault
         def wrapped_handler(match: SecretMatch) -> str:
@@ -270,7 +269,7 @@ class SaveDeployMixin:
                         line_number=match.line_number,
                         pattern_name=match.pattern_name,
                         secret_value=match.matched_text,
-                        branch=self.current_branch,
+                        branch=branch,
                     )
                     # Return formatted redaction string with hash
                     return f"***REDACTED:{secret_hash}***"
@@ -483,7 +482,7 @@ class SaveDeployMixin:
             all_errors: list[str] = []
             all_symlinks: list[Path] = []
 
-            sections = [self.get_section(name) for name in self.get_sections()]
+            sections = self.get_all_sections()
 
             with self.vault.batch(), ThreadPoolExecutor() as executor:
                 future_to_section = {
@@ -516,7 +515,7 @@ class SaveDeployMixin:
         Returns dict with keys: 'deployed', 'pre_hooks', 'post_hooks', 'errors'
         """
         with FileLock(LOCK_FILE):
-            sections = [self.get_section(name) for name in self.get_sections()]
+            sections = self.get_all_sections()
             plan = self.scan_deployable_changes(sections)
             result = self.execute_deployment_plan(plan)
             return result
@@ -14,6 +14,7 @@ __all__ = [
 
 import json
 import logging
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
@@ -359,20 +360,24 @@ class SecretScanner:
         """Scan all files in a directory for secrets."""
         exclude_patterns = exclude_patterns or []
 
-        for path in directory.rglob("*"):
-            # Skip directories
-            if path.is_dir():
-                continue
+        # Skip .git directory
+        if ".git" in directory.parts:
+            return
 
-            # Skip .git directory
-            if ".git" in path.parts:
-                continue
+        # os.walk reuses scandir's cached d_type instead of stat-ing every
+        # entry, and only files that survive the filters become Path objects.
+        for root, dirs, files in os.walk(directory, followlinks=False):
+            if ".git" in dirs:
+                dirs.remove(".git")
 
-            # Skip excluded patterns
-            if any(path.match(pattern) for pattern in exclude_patterns):
-                continue
+            for name in files:
+                path = Path(root, name)
+
+                # Skip excluded patterns
+                if any(path.match(pattern) for pattern in exclude_patterns):
+                    continue
 
-            yield from self.scan_file(path)
+                yield from self.scan_file(path)
 
     def redact_content(
         self,
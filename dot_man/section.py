@@ -24,6 +24,33 @@ VALID_DEPLOY_METHODS = ["copy", "symlink"]
 class Section:
     """Represents a resolved configuration section with smart defaults."""
 
+    # Fixed attribute layout: configs can resolve hundreds of sections, and
+    # slots keep each instance small and turn attribute typos into errors
+    __slots__ = (
+        "name",
+        "paths",
+        "repo_path",
+        "repo_base",
+        "_auto_repo_base",
+        "secrets_filter",
+        "update_strategy",
+        "include",
+        "exclude",
+        "pre_deploy",
+        "post_deploy",
+        "on_activate",
+        "on_deactivate",
+        "inherits",
+        "ignored_directories",
+        "follow_symlinks",
+        "deploy_method",
+        "encrypted",
+        "encryption_method",
+        "encryption_recipient",
+        "render_templates",
+        "_repo_prefix",
+    )
+
     def __init__(
         self,
         name: str,
@@ -50,10 +77,12 @@ class Section:
         # Expand environment variables in paths
         self.paths = [_expand_path(str(p)) if isinstance(p, str) else p for p in paths]
         self.repo_path = repo_path
+        # Memoized auto-generated repo_base: ((name, first_path), repo_base)
+        self._auto_repo_base: Optional[tuple[tuple, str]] = None
 
         # Smart repo_base generation if not provided
         if repo_base is None and not repo_path:
-            self.repo_base = self._generate_repo_base()
+            self.repo_base = self._get_auto_repo_base()
         else:
             self.repo_base = repo_base or name
 
@@ -88,6 +117,10 @@ class Section:
         # Template rendering ({{VAR}} substitution + conditionals)
         self.render_templates = True
 
+        # Memoized repo prefix for get_repo_path:
+        # ((repo_dir, repo_base, repo_path), prefix)
+        self._repo_prefix: Optional[tuple[tuple, Path]] = None
+
     def _generate_repo_base(self) -> str:
         """Auto-generate repo_base from first path.
 
@@ -124,6 +157,19 @@ class Section:
         # Fallback: use stem or name
         return first_path.stem or first_path.name
 
+    def _get_auto_repo_base(self) -> str:
+        """Return _generate_repo_base(), recomputed only when its inputs change.
+
+        Generation may stat the first path, so the result is keyed on the
+        name and first path and reused by __init__ and every to_dict call.
+        """
+        key = (self.name, self.paths[0] if self.paths else None)
+        cached = self._auto_repo_base
+        if cached is None or cached[0] != key:
+            cached = (key, self._generate_repo_base())
+            self._auto_repo_base = cached
+        return cached[1]
+
     def _resolve_hook(self, hook: str | None) -> str | None:
         """Resolve hook aliases to actual commands, replacing placeholders.
 
@@ -148,20 +194,25 @@ class Section:
 
         if "{" in resolved:
             resolved = resolved.replace("{section_name}", self.name)
-            resolved = resolved.replace("{branch}", self._get_current_branch())
-            resolved = resolved.replace("{paths}", " ".join(str(p) for p in self.paths))
-
-            if self.paths:
+            # Branch lookup opens the git repo; only pay for it when used
+            if "{branch}" in resolved:
+                resolved = resolved.replace("{branch}", self._get_current_branch())
+            if "{paths}" in resolved:
+                resolved = resolved.replace(
+                    "{paths}", " ".join(str(p) for p in self.paths)
+                )
+
+            if self.paths and (
+                "{config_root}" in resolved
+                or "{config_name}" in resolved
+                or "{qs_config}" in resolved
+            ):
                 first = self.paths[0]
+                # Existing paths are used as-is; others are expanded first
+                if not first.exists():
+                    first = first.expanduser()
                 config_root = str(first.parent)
                 config_name = first.name
-                if first.exists() and first.is_dir():
-                    config_name = first.name
-                elif first.exists() and first.is_file():
-                    config_root = str(first.parent)
-                else:
-                    config_root = str(first.expanduser().parent)
-                    config_name = first.expanduser().name
                 resolved = resolved.replace("{config_root}", config_root)
                 resolved = resolved.replace("{config_name}", config_name)
                 resolved = resolved.replace("{qs_config}", config_name)
@@ -182,12 +233,26 @@ class Section:
             return "unknown"
 
     def get_repo_path(self, local_path: Path, repo_dir: Path) -> Path:
-        """Get the repository path for a local path."""
+        """Get the repository path for a local path.
+
+        The section's prefix inside ``repo_dir`` is joined once and reused
+        while ``repo_dir``, ``repo_base`` and ``repo_path`` are unchanged, so
+        per-file calls cost at most one path join.
+        """
+        key = (repo_dir, self.repo_base, self.repo_path)
+        if self._repo_prefix is None or self._repo_prefix[0] != key:
+            if self.repo_path:
+                # Explicit repo_path for single files
+                prefix = repo_dir / self.repo_path
+            else:
+                prefix = repo_dir / self.repo_base
+            self._repo_prefix = (key, prefix)
+        prefix = self._repo_prefix[1]
+
         if self.repo_path:
-            # Explicit repo_path for single files
-            return repo_dir / self.repo_path
+            return prefix
         # Use repo_base + filename
-        return repo_dir / self.repo_base / local_path.name
+        return prefix / local_path.name
 
     def to_dict(self) -> dict[str, Any]:
         """Convert section to dictionary (only non-default values)."""
@@ -198,7 +263,7 @@ class Section:
         # Only include if non-default or explicitly set
         if self.repo_path:
             result["repo_path"] = self.repo_path
-        elif self.repo_base != self._generate_repo_base():
+        elif self.repo_base != self._get_auto_repo_base():
             # Only save repo_base if it differs from auto-generated
             result["repo_base"] = self.repo_base
 
@@ -48,12 +48,16 @@ class LogViewerApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        ops = get_operations()
-        commits = list(ops.git.get_commits(count=50))
-
+        # Resolve operations once; every selection handler reuses them
+        self._ops = get_operations()
+        # Rendered markdown by commit SHA; commits are immutable, so revisiting
+        # one never needs another `git show` subprocess
+        self._diff_cache: dict[str, str] = {}
+        commits = list(self._ops.git.get_commits(count=50))
+
+        # Mount all items in one batch rather than one DOM update per commit
         commit_list = self.query_one("#commit-list", ListView)
-        for commit in commits:
-            commit_list.append(CommitItem(commit))
+        commit_list.extend(CommitItem(commit) for commit in commits)
 
         if commits:
             self._show_commit_diff(commits[0]["sha"])
@@ -63,7 +67,13 @@ class LogViewerApp(App):
             self._show_commit_diff(event.item.commit["sha"])
 
     def _show_commit_diff(self, sha: str) -> None:
-        ops = get_operations()
+        diff_view = self.query_one("#diff-view", Markdown)
+        md_content = self._diff_cache.get(sha)
+        if md_content is not None:
+            diff_view.update(md_content)
+            return
+
+        ops = self._ops
         try:
             # We want the diff and stats
             commit_obj = ops.git.repo.commit(sha)
@@ -79,10 +89,9 @@ class LogViewerApp(App):
             diff_text = ops.git.repo.git.show(sha, patch=True, color="never")
             md_content += f"## Diff\n\n```diff\n{diff_text}\n```"
 
-            diff_view = self.query_one("#diff-view", Markdown)
+            self._diff_cache[sha] = md_content
             diff_view.update(md_content)
         except Exception as e:
-            diff_view = self.query_one("#diff-view", Markdown)
             diff_view.update(f"Error loading commit diff: {e}")
 
 
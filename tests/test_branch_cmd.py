@@ -186,6 +186,19 @@ class TestBranchList:
         assert "work" in result.output
         assert "✓" in result.output
 
+    def test_list_reuses_shared_global_config(self, clean_env):
+        """Repeated branch list calls in one process load global config once."""
+        runner, _, _, _ = clean_env
+        from dot_man.global_config import GlobalConfig
+
+        with patch.object(
+            GlobalConfig, "load", autospec=True, side_effect=GlobalConfig.load
+        ) as mock_load:
+            runner.invoke(cli, ["branch", "list"])
+            result = runner.invoke(cli, ["branch", "list"])
+        assert result.exit_code == 0
+        assert mock_load.call_count == 1
+
     def test_list_no_branches(self, clean_env):
         """branch list when no branches exist shows dim message."""
         runner, _, _, _ = clean_env
@@ -46,6 +46,9 @@ class FakeOps(BranchMixin):
     def get_section(self, name):
         return self._sections[name]
 
+    def get_all_sections(self):
+        return list(self._sections.values())
+
     @property
     def backups(self):
         return self._backups
@@ -97,6 +97,25 @@ class TestCompletionCaching:
         _clear_completion_cache()
         # Should not raise
 
+    def test_file_cache_roundtrip_and_missing_file(self, tmp_path):
+        import importlib
+
+        # dot_man.cli.completions is shadowed by the command of the same name
+        completions = importlib.import_module("dot_man.cli.completions")
+
+        cache_file = tmp_path / ".dotman" / "completion_cache.json"
+        with (
+            patch.object(completions, "REPO_DIR", tmp_path),
+            patch.object(completions, "COMPLETION_CACHE_FILE", cache_file),
+        ):
+            completions._clear_completion_cache()
+            assert completions._get_completion_cache() == {}
+
+            completions._save_completion_cache({"branches": ["main", "wörk"]})
+            completions._memory_cache = None  # force a read from the file
+            assert completions._get_completion_cache() == {"branches": ["main", "wörk"]}
+        completions._clear_completion_cache()
+
 
 class TestHandleException:
     """Test centralized exception handler."""
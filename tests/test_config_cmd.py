@@ -156,6 +156,16 @@ class TestConfigListInitialized:
         assert "remote.url" in result.output
         assert "git@example.com" in result.output
 
+    def test_config_list_flattens_nested_tables_sorted(self, integration_runner):
+        integration_runner.invoke(cli, ["config", "set", "zeta.inner.key", "z1"])
+        integration_runner.invoke(cli, ["config", "set", "alpha.key", "a1"])
+        result = integration_runner.invoke(cli, ["config", "list"], terminal_width=200)
+        assert result.exit_code == 0
+        out = result.output
+        assert "zeta.inner.key" in out
+        assert out.index("alpha.key") < out.index("remote.url")
+        assert out.index("remote.url") < out.index("zeta.inner.key")
+
 
 class TestConfigGetExistingKey:
     """Tests for 'config get' against an initialized repo."""
@@ -211,6 +221,14 @@ class TestConfigSetValues:
         r2 = integration_runner.invoke(cli, ["config", "get", "remote.auto_sync"])
         assert "False" in r2.output
 
+    def test_set_boolean_is_case_insensitive(self, integration_runner):
+        r = integration_runner.invoke(
+            cli, ["config", "set", "remote.auto_sync", "TRUE"]
+        )
+        assert r.exit_code == 0
+        r2 = integration_runner.invoke(cli, ["config", "get", "remote.auto_sync"])
+        assert "True" in r2.output
+
     def test_set_creates_new_section(self, integration_runner):
         r = integration_runner.invoke(
             cli, ["config", "set", "custom.key", "custom_value"]
@@ -252,6 +270,19 @@ class TestConfigCreate:
         assert result.exit_code == 0
         assert "minimal config" in result.output
 
+    def test_create_minimal_overwrites_existing(self, integration_runner):
+        from dot_man.constants import DOT_MAN_TOML, REPO_DIR
+
+        integration_runner.invoke(cli, ["config", "create", "--force"])
+        config_path = REPO_DIR / DOT_MAN_TOML
+        assert "# [bashrc]" in config_path.read_text()
+
+        result = integration_runner.invoke(
+            cli, ["config", "create", "--minimal", "--force"]
+        )
+        assert result.exit_code == 0
+        assert config_path.read_text() == ""
+
     def test_create_force_overwrite(self, integration_runner):
         integration_runner.invoke(cli, ["config", "create", "--force"])
         result = integration_runner.invoke(cli, ["config", "create", "--force"])
@@ -220,6 +220,31 @@ class TestGitManagerStatus:
 
         assert gm.is_dirty()
 
+    def test_status_porcelain(self, temp_repo):
+        """Test status_porcelain reports modified, untracked, and renamed files."""
+        from dot_man.core import GitManager
+
+        gm = GitManager(temp_repo)
+
+        (temp_repo / "test.txt").write_text("test")
+        (temp_repo / "old name.txt").write_text("rename me")
+        repo = Repo(temp_repo)
+        repo.index.add(["test.txt", "old name.txt"])
+        repo.index.commit("Initial")
+
+        assert gm.status_porcelain() == []
+
+        (temp_repo / "test.txt").write_text("changed")
+        (temp_repo / "new.txt").write_text("new")
+        repo.git.mv("old name.txt", "new name.txt")
+
+        entries = dict((path, code) for code, path in gm.status_porcelain())
+        assert entries == {
+            "test.txt": " M",
+            "new.txt": "??",
+            "new name.txt": "R ",
+        }
+
     def test_get_status(self, temp_repo):
         """Test get_status."""
         from dot_man.core import GitManager
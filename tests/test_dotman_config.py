@@ -1,5 +1,6 @@
 """Tests for dotman_config module."""
 
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -23,6 +24,31 @@ class TestDotManConfigInit:
         config = DotManConfig(tmp_path)
         assert config.repo_path == tmp_path
 
+    def test_default_repo_reuses_precomputed_paths(self):
+        """Test the default repo path uses the config paths joined at import."""
+        from dot_man.constants import DEFAULT_CONFIG_PATHS
+        from dot_man.dotman_config import DotManConfig
+
+        with patch("dot_man.dotman_config.os.listdir", return_value=[]):
+            config = DotManConfig()
+        assert config._path is DEFAULT_CONFIG_PATHS[0]
+
+    def test_config_file_probe_uses_one_listing(self, tmp_path):
+        """Test config discovery lists the repo once and keeps priority."""
+        import os
+
+        from dot_man.dotman_config import DotManConfig
+
+        (tmp_path / "dot-man.yaml").write_text("")
+        (tmp_path / "dot-man.toml").write_text("")
+
+        with patch("dot_man.dotman_config.os.listdir", wraps=os.listdir) as ls:
+            config = DotManConfig(tmp_path)
+        ls.assert_called_once_with(tmp_path)
+        assert config._path == tmp_path / "dot-man.toml"
+
+        assert DotManConfig(tmp_path / "missing")._path.name == "dot-man.toml"
+
 
 class TestDotManConfigProperties:
     """Test DotManConfig properties."""
@@ -60,6 +86,471 @@ class TestDotManConfigSave:
             config = DotManConfig()
             config.save()  # Should not raise
 
+    def test_save_skips_unchanged_data(self, tmp_path):
+        """Test forced saves of unchanged data do not rewrite the file."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config.create_default()
+        config.load()
+
+        with patch("dot_man.dotman_config.write_config_file") as mock_write:
+            config.save(force=True)
+            mock_write.assert_not_called()
+
+            config.add_section("bash", ["~/.bashrc"])
+            config.save()
+            mock_write.assert_called_once()
+
+    def test_save_merges_only_changed_sections(self, tmp_path, monkeypatch):
+        """Test only modified tables are merged into the preserved document."""
+        from dot_man.dotman_config import DotManConfig
+        from dot_man.global_config import update_config_doc
+
+        # The file is written just below; let its stamp vouch for the document
+        monkeypatch.setattr("dot_man.global_config._RACY_WINDOW_NS", 0)
+
+        (tmp_path / "dot-man.toml").write_text(
+            '[bash]\npaths = ["~/.bashrc"]  # shell\n\n'
+            '[vim]\npaths = ["~/.vimrc"]  # editor\n'
+        )
+        config = DotManConfig(tmp_path)
+        config.load()
+        config.update_section("vim", update_strategy="ignore")
+        config.remove_section("bash")
+        config.add_section("zsh", ["~/.zshrc"])
+
+        with patch(
+            "dot_man.global_config.update_config_doc", wraps=update_config_doc
+        ) as mock_update:
+            config.save()
+        assert sorted(mock_update.call_args_list[0].args[2]) == ["vim", "zsh"]
+
+        text = (tmp_path / "dot-man.toml").read_text()
+        assert "# editor" in text
+        assert "[bash]" not in text
+        config.load()
+        assert config.get_section("vim").update_strategy == "ignore"
+        assert config.get_section_names() == ["vim", "zsh"]
+
+    def test_save_after_external_edit_keeps_loaded_sections(self, tmp_path):
+        """Test a file rewritten after load is fully replaced by our data."""
+        import os
+
+        from dot_man.dotman_config import DotManConfig
+
+        path = tmp_path / "dot-man.toml"
+        path.write_text('[a]\npaths = ["~/.a"]\n')
+        config = DotManConfig(tmp_path)
+        config.load()
+
+        path.write_text('[b]\npaths = ["~/.b"]\n')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        config.add_section("n", ["~/.n"])
+        config.save()
+
+        text = path.read_text()
+        assert "[a]" in text and "[n]" in text
+        assert "[b]" not in text
+
+    def test_document_parsed_only_when_saving(self, tmp_path):
+        """Test load reads plain data; save parses the document to keep comments."""
+        import tomlkit
+
+        from dot_man.dotman_config import DotManConfig
+
+        (tmp_path / "dot-man.toml").write_text('[bash]\npaths = ["~/.bashrc"]  # sh\n')
+        config = DotManConfig(tmp_path)
+        with patch("tomlkit.parse", wraps=tomlkit.parse) as mock_parse:
+            config.load()
+            config.get_section("bash")
+            mock_parse.assert_not_called()
+
+            config.add_section("vim", ["~/.vimrc"])
+            config.save()
+            mock_parse.assert_called_once()
+
+        assert "# sh" in (tmp_path / "dot-man.toml").read_text()
+
+    def test_create_default_single_write(self, tmp_path):
+        """Test create_default writes data and examples with one write."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        with patch("dot_man.files.atomic_open") as mock_write:
+            config.create_default()
+        mock_write.assert_called_once()
+
+        config.create_default()
+        assert "# [bashrc]" in (tmp_path / "dot-man.toml").read_text()
+        config.load()
+        assert config.get_section_names() == []
+
+
+class TestDotManConfigAddSection:
+    """Test add_section validation."""
+
+    def test_paths_validated_and_stripped(self, tmp_path):
+        """Test blank and absolute paths are rejected; others are stripped."""
+        from dot_man.dotman_config import DotManConfig
+        from dot_man.exceptions import ConfigurationError
+
+        config = DotManConfig(tmp_path)
+        for bad, message in [
+            (["  "], "non-empty"),
+            ([None], "non-empty"),
+            (["/etc/hosts"], "relative"),
+        ]:
+            with pytest.raises(ConfigurationError, match=message):
+                config.add_section("bad", bad)
+
+        config.add_section(
+            "bash", [" ~/.bashrc "], post_deploy="echo hi", exclude=["*.bak"]
+        )
+        assert config._data["bash"] == {
+            "paths": ["~/.bashrc"],
+            "repo_base": "bash",
+            "post_deploy": "echo hi",
+            "exclude": ["*.bak"],
+        }
+        assert list(config._data["bash"]) == [
+            "paths",
+            "repo_base",
+            "post_deploy",
+            "exclude",
+        ]
+
+
+class TestDotManConfigSectionCache:
+    """Test get_section memoization."""
+
+    def test_get_section_memoized_and_invalidated(self, tmp_path):
+        """Test sections resolve once and are re-resolved after mutation."""
+        from dot_man.dotman_config import DotManConfig
+        from dot_man.section import Section
+
+        config = DotManConfig(tmp_path)
+        config.add_section("bash", ["~/.bashrc"])
+
+        with patch("dot_man.dotman_config.Section", wraps=Section) as mock_section:
+            first = config.get_section("bash")
+            first.update_strategy = "ignore"
+            second = config.get_section("bash")
+            assert mock_section.call_count == 1
+            assert first is not second
+            assert second.update_strategy == "replace"
+
+            config.update_section("bash", update_strategy="rename_old")
+            assert config.get_section("bash").update_strategy == "rename_old"
+            assert mock_section.call_count == 2
+
+
+class TestDotManConfigGetAllSections:
+    """Test get_all_sections batch resolution."""
+
+    def test_resolves_all_with_one_context_lookup(self, tmp_path):
+        """Test one defaults/templates lookup serves the whole pass."""
+        from unittest.mock import MagicMock
+
+        from dot_man.dotman_config import DotManConfig
+
+        global_config = MagicMock()
+        global_config.get_defaults.return_value = {"update_strategy": "ignore"}
+        global_config.get_all_templates.return_value = {}
+
+        config = DotManConfig(tmp_path, global_config=global_config)
+        config._data = {
+            "a": {"paths": ["~/.a"]},
+            "b": {"paths": ["~/.b"], "inherits": ["missing"]},
+        }
+        cached = config.get_section("a")
+
+        sections = config.get_all_sections()
+        assert [s.name for s in sections] == ["a", "b"]
+        assert all(s.update_strategy == "ignore" for s in sections)
+        assert sections[0] is not cached
+        # One lookup for get_section("a"), one for the rest of the pass
+        assert global_config.get_defaults.call_count == 2
+
+        config.get_all_sections()
+        assert global_config.get_defaults.call_count == 2
+
+
+class TestDotManConfigIterSections:
+    """Test lazy section iteration."""
+
+    def test_iter_sections_yields_names_without_resolving(self, tmp_path):
+        """Test names are listed without building Section objects."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config._data = {
+            "templates": {"base": {}},
+            "bash": {"paths": ["~/.bashrc"]},
+            "broken": {"update_strategy": "bogus"},
+        }
+
+        with patch("dot_man.dotman_config.Section") as mock_section:
+            assert list(config.iter_sections()) == ["bash", "broken"]
+            assert list(config) == ["bash", "broken"]
+            assert config.get_section_names() == ["bash", "broken"]
+            config.get_section("bash")
+        assert mock_section.call_count == 1
+
+
+class TestDotManConfigUpdateSection:
+    """Test update_section change tracking."""
+
+    def test_unchanged_update_stays_clean(self, tmp_path):
+        """Test re-applying current values leaves the config clean."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config._data = {"bash": {"paths": ["~/.bashrc"], "repo_base": "bash"}}
+
+        config.update_section("bash", repo_base="bash", exclude=None)
+        assert config._dirty is False
+
+        config.update_section("bash", exclude=["*.bak"])
+        assert config._dirty is True
+        assert config._data["bash"]["exclude"] == ["*.bak"]
+
+
+class TestDotManConfigChoiceValidation:
+    """Test enumerated section settings are checked in get_section."""
+
+    def test_invalid_deploy_method_lists_options(self, tmp_path):
+        """Test an unknown deploy_method names the valid methods."""
+        from dot_man.dotman_config import DotManConfig
+        from dot_man.exceptions import ConfigValidationError
+
+        config = DotManConfig(tmp_path)
+        config._data = {"bash": {"paths": ["~/.bashrc"], "deploy_method": "hard"}}
+
+        with pytest.raises(ConfigValidationError, match="'copy', 'symlink'"):
+            config.get_section("bash")
+
+    def test_valid_deploy_method_is_kept(self, tmp_path):
+        """Test a valid deploy_method reaches the Section."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config._data = {"bash": {"paths": ["~/.bashrc"], "deploy_method": "symlink"}}
+
+        assert config.get_section("bash").deploy_method == "symlink"
+
+
+class TestDotManConfigMergeSettings:
+    """Test settings layering in get_section."""
+
+    def test_layers_merge_without_mutating_sources(self, tmp_path):
+        """Test defaults < templates < section, leaving sources untouched."""
+        from unittest.mock import MagicMock
+
+        from dot_man.dotman_config import DotManConfig
+
+        defaults = {"update_strategy": "rename_old", "secrets_filter": False}
+        template = {"update_strategy": "ignore", "exclude": ["*.log"]}
+        global_config = MagicMock()
+        global_config.get_defaults.return_value = defaults
+        global_config.get_all_templates.return_value = {"base": template}
+
+        config = DotManConfig(tmp_path, global_config=global_config)
+        config._data = {
+            "app": {"paths": ["~/.app"], "inherits": "base", "exclude": ["*.tmp"]}
+        }
+        section = config.get_section("app")
+
+        assert section.update_strategy == "ignore"
+        assert section.secrets_filter is False
+        assert section.exclude == ["*.tmp"]
+        assert section.inherits == ["base"]
+        assert defaults == {"update_strategy": "rename_old", "secrets_filter": False}
+        assert template == {"update_strategy": "ignore", "exclude": ["*.log"]}
+
+    def test_section_without_inherits_overrides_defaults(self, tmp_path):
+        """Test the no-inherits fast path layers section keys over defaults."""
+        from unittest.mock import MagicMock
+
+        from dot_man.dotman_config import DotManConfig
+
+        defaults = {"update_strategy": "rename_old", "exclude": ["*.bak"]}
+        global_config = MagicMock()
+        global_config.get_defaults.return_value = defaults
+
+        config = DotManConfig(tmp_path, global_config=global_config)
+        config._data = {
+            "app": {"paths": ["~/.app"], "inherits": [], "exclude": ["*.tmp"]}
+        }
+        section = config.get_section("app")
+
+        assert section.update_strategy == "rename_old"
+        assert section.exclude == ["*.tmp"]
+        assert section.inherits == []
+        assert defaults == {"update_strategy": "rename_old", "exclude": ["*.bak"]}
+
+    def test_template_tables_fetched_once_per_section(self, tmp_path):
+        """Test inherits resolve local before global from one table fetch."""
+        from unittest.mock import MagicMock
+
+        from dot_man.dotman_config import DotManConfig
+
+        global_config = MagicMock()
+        global_config.get_defaults.return_value = {}
+        global_config.get_all_templates.return_value = {
+            "shell": {"update_strategy": "ignore", "exclude": ["*.log"]},
+            "local": {"update_strategy": "rename_old"},
+        }
+
+        config = DotManConfig(tmp_path, global_config=global_config)
+        config._data = {
+            "templates": {"local": {"update_strategy": "replace"}},
+            "app": {"paths": ["~/.app"], "inherits": ["shell", "local", "missing"]},
+        }
+        section = config.get_section("app")
+
+        assert section.update_strategy == "replace"
+        assert section.exclude == ["*.log"]
+        global_config.get_all_templates.assert_called_once()
+        global_config.get_template.assert_not_called()
+
+
+class TestDotManConfigPathExpansion:
+    """Test path expansion in get_section."""
+
+    def test_paths_expand_home_and_variables(self, tmp_path, monkeypatch):
+        """Test ~ uses the home resolved at init; $VARS still expand."""
+        from dot_man.dotman_config import DotManConfig
+
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("DOTMAN_TEST_DIR", "cfg")
+        config = DotManConfig(tmp_path)
+        config._data = {
+            "app": {"paths": ["~", "~/.app", "~/$DOTMAN_TEST_DIR/x", "/etc/app"]}
+        }
+
+        with patch("dot_man.dotman_config.os.path.expanduser") as expanduser:
+            section = config.get_section("app")
+        expanduser.assert_not_called()
+
+        home = tmp_path / "home"
+        assert section.paths == [
+            home,
+            home / ".app",
+            home / "cfg" / "x",
+            Path("/etc/app"),
+        ]
+
+    def test_root_home_does_not_double_slash(self, tmp_path, monkeypatch):
+        """Test a home of "/" expands like os.path.expanduser."""
+        from dot_man.dotman_config import DotManConfig
+
+        monkeypatch.setenv("HOME", "/")
+        config = DotManConfig(tmp_path)
+        config._data = {"app": {"paths": ["~/.app", "~"]}}
+
+        assert [str(p) for p in config.get_section("app").paths] == ["/.app", "/"]
+
+
+class TestDotManConfigValidate:
+    """Test validate path checks."""
+
+    def test_missing_paths_share_parent_listing(self, tmp_path):
+        """Test sibling paths are checked with one scandir of their parent."""
+        import os
+
+        from dot_man.dotman_config import DotManConfig
+
+        (tmp_path / "present").write_text("x")
+        (tmp_path / "dangling").symlink_to(tmp_path / "nowhere")
+        config = DotManConfig(tmp_path)
+        config._data = {
+            "files": {
+                "paths": [
+                    str(tmp_path / "present"),
+                    str(tmp_path / "absent"),
+                    str(tmp_path / "dangling"),
+                    str(tmp_path / "no-dir" / "child"),
+                ]
+            }
+        }
+
+        with patch("dot_man.dotman_config.os.scandir", wraps=os.scandir) as scan:
+            warnings = config.validate()
+
+        assert scan.call_count == 2
+        assert warnings == [
+            f"[files]: Path does not exist: {tmp_path / 'absent'}",
+            f"[files]: Path does not exist: {tmp_path / 'dangling'}",
+            f"[files]: Path does not exist: {tmp_path / 'no-dir' / 'child'}",
+        ]
+
+    def test_many_parents_listed_from_thread_pool(self, tmp_path):
+        """Test large configs prefetch parent listings concurrently."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config._data = {}
+        for i in range(20):
+            parent = tmp_path / f"d{i}"
+            parent.mkdir()
+            (parent / "present").write_text("x")
+            config._data[f"s{i}"] = {
+                "paths": [str(parent / "present"), str(parent / "absent")]
+            }
+
+        with patch(
+            "concurrent.futures.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as pool:
+            warnings = config.validate()
+
+        pool.assert_called_once_with(max_workers=20)
+        assert warnings == [
+            f"[s{i}]: Path does not exist: {tmp_path / f'd{i}' / 'absent'}"
+            for i in range(20)
+        ]
+
+    def test_unknown_keys_reported_in_file_order(self, tmp_path):
+        """Test unknown keys are reported once each, in table order."""
+        from dot_man.dotman_config import DotManConfig
+
+        config = DotManConfig(tmp_path)
+        config._data = {
+            "ok": {"paths": [str(tmp_path)], "exclude": []},
+            "bad": {"zeta": 1, "paths": [str(tmp_path)], "alpha": 2, "beta": 3},
+        }
+
+        assert config.validate() == [
+            "[bad]: Unknown key 'zeta'",
+            "[bad]: Unknown key 'alpha'",
+            "[bad]: Unknown key 'beta'",
+        ]
+
+    def test_template_tables_read_once(self, tmp_path):
+        """Test template lookups are shared across sections in validate."""
+        from unittest.mock import MagicMock
+
+        from dot_man.dotman_config import DotManConfig
+
+        global_config = MagicMock()
+        global_config.get_defaults.return_value = {}
+        global_config.get_all_templates.return_value = {"shell": {}}
+
+        config = DotManConfig(tmp_path, global_config=global_config)
+        config._data = {
+            "templates": {"local": {}},
+            "a": {"paths": [str(tmp_path)], "inherits": ["shell", "local"]},
+            "b": {"paths": [str(tmp_path)], "inherits": ["missing"]},
+        }
+
+        assert config.validate() == ["[b]: Template not found: missing"]
+        # Sections are resolved against validate's own lookup
+        assert global_config.get_all_templates.call_count == 1
+        global_config.get_template.assert_not_called()
+
 
 class TestConfigConstants:
     """Test config module constants."""
@@ -106,6 +106,27 @@ class TestErrorDiagnostic:
         )
         assert diag.category == ErrorCategory.CONFIG
         assert diag.title == "Test Error"
+        assert not hasattr(diag, "__dict__")
+
+    def test_from_exception_message_checks(self):
+        """Message checks keep their precedence over exception types."""
+        from dot_man.exceptions import (
+            ErrorCategory,
+            ErrorDiagnostic,
+            GitOperationError,
+        )
+
+        denied = ErrorDiagnostic.from_exception(
+            GitOperationError("Permission Denied (publickey)")
+        )
+        assert denied.category == ErrorCategory.PERMISSION
+        assert denied.details == "Permission Denied (publickey)"
+
+        conflict = ErrorDiagnostic.from_exception(GitOperationError("Merge CONFLICT"))
+        assert conflict.category == ErrorCategory.GIT_CONFLICT
+
+        missing = ErrorDiagnostic.from_exception(RuntimeError("vim: Command not found"))
+        assert missing.category == ErrorCategory.COMMAND
 
 
 class TestErrorCategory:
@@ -121,3 +142,10 @@ class TestErrorCategory:
         assert ErrorCategory.CONFIG.value == "config"
         assert ErrorCategory.DISK.value == "disk"
         assert ErrorCategory.NETWORK.value == "network"
+
+    def test_error_category_compares_to_value(self):
+        """Categories compare equal to their string values."""
+        from dot_man.exceptions import ErrorCategory
+
+        assert ErrorCategory.SECRETS == "secrets"
+        assert ErrorCategory("disk") is ErrorCategory.DISK
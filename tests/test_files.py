@@ -0,0 +1,67 @@
+"""Tests for glob pattern compilation in the files module."""
+
+import fnmatch
+
+from dot_man.files import _compile_glob_set
+
+PATTERNS = (
+    "*.log",
+    "file?.txt",
+    "[abc]*.conf",
+    "[!x]*.tmp",
+    "notes(1).md",
+    "a+b.txt",
+    "$HOME|x",
+    "^caret.ini",
+    "dots...{2}",
+    "back\\slash",
+)
+
+NAMES = [
+    "app.log",
+    "app.logx",
+    "file1.txt",
+    "file12.txt",
+    "a.conf",
+    "d.conf",
+    "y.tmp",
+    "x.tmp",
+    "notes(1).md",
+    "notes1.md",
+    "a+b.txt",
+    "aab.txt",
+    "$HOME|x",
+    "HOME",
+    "x",
+    "^caret.ini",
+    "caret.ini",
+    "dots...{2}",
+    "dots..",
+    "back\\slash",
+    "backslash",
+]
+
+
+class TestCompileGlobSet:
+    """Test the combined glob alternation against fnmatch."""
+
+    def test_matches_fnmatch_for_mixed_patterns(self):
+        """Every name matches the alternation exactly when fnmatch matches."""
+        compiled = _compile_glob_set(PATTERNS)
+        assert compiled is not None
+        for name in NAMES:
+            expected = any(fnmatch.fnmatch(name, p) for p in PATTERNS)
+            assert bool(compiled.match(name)) is expected, name
+
+    def test_matches_fnmatch_per_pattern(self):
+        """A single-pattern set agrees with fnmatch for that pattern."""
+        for pattern in PATTERNS:
+            compiled = _compile_glob_set((pattern,))
+            assert compiled is not None
+            for name in NAMES:
+                expected = fnmatch.fnmatch(name, pattern)
+                assert bool(compiled.match(name)) is expected, (pattern, name)
+
+    def test_empty_pattern_list(self):
+        """An empty pattern list compiles to None."""
+        assert _compile_glob_set(()) is None
@@ -1,4 +1,6 @@
-from dot_man.files import atomic_write_text, smart_save_file
+import pytest
+
+from dot_man.files import atomic_open, atomic_write_text, smart_save_file
 
 
 def test_atomic_write_text(tmp_path):
@@ -24,6 +26,53 @@ def test_atomic_write_text_overwrite(tmp_path):
     assert dest.read_text(encoding="utf-8") == new_content
 
 
+def test_atomic_open_failure_keeps_original(tmp_path):
+    dest = tmp_path / "stream.txt"
+    dest.write_text("Old Content", encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(dest) as fh:
+            fh.write("partial")
+            raise RuntimeError("serializer failed")
+
+    assert dest.read_text(encoding="utf-8") == "Old Content"
+    assert not (tmp_path / "stream.txt.tmp").exists()
+
+    with atomic_open(dest) as fh:
+        fh.write("New ")
+        fh.write("Content")
+    assert dest.read_text(encoding="utf-8") == "New Content"
+
+
+def test_atomic_open_buffering_defers_writes(tmp_path):
+    dest = tmp_path / "buffered.txt"
+
+    with atomic_open(dest, buffering=128 * 1024) as fh:
+        for i in range(100):
+            fh.write(f"line {i}\n")
+        # Nothing has reached the temp file until the buffer is flushed
+        assert (tmp_path / "buffered.txt.tmp").stat().st_size == 0
+
+    assert dest.read_text(encoding="utf-8").count("\n") == 100
+
+
+def test_atomic_open_fsync_before_replace(tmp_path):
+    from unittest.mock import patch
+
+    dest = tmp_path / "synced.txt"
+
+    with patch("dot_man.files.os.fsync") as mock_fsync:
+        with atomic_open(dest) as fh:
+            fh.write("plain")
+        mock_fsync.assert_not_called()
+
+        with atomic_open(dest, fsync=True) as fh:
+            fh.write("synced")
+        mock_fsync.assert_called_once()
+
+    assert dest.read_text(encoding="utf-8") == "synced"
+
+
 def test_smart_save_file_identical(tmp_path):
     src = tmp_path / "src.txt"
     dest = tmp_path / "dest.txt"
@@ -54,6 +103,70 @@ def test_smart_save_file_modified_content(tmp_path):
     assert dest.read_text(encoding="utf-8") == "New Content"
 
 
+def test_smart_save_file_compares_large_files_in_chunks(tmp_path):
+    src = tmp_path / "src_large.txt"
+    dest = tmp_path / "dest_large.txt"
+    content = "line of config\n" * 20000
+
+    src.write_text(content, encoding="utf-8")
+    dest.write_text(content, encoding="utf-8")
+    dest.chmod(src.stat().st_mode)
+
+    saved, _ = smart_save_file(src, dest)
+    assert not saved
+
+    src.write_text(content[:-2] + "X\n", encoding="utf-8")
+    saved, _ = smart_save_file(src, dest)
+    assert saved
+    assert dest.read_text(encoding="utf-8") == content[:-2] + "X\n"
+
+
+def test_smart_save_file_skips_reading_unchanged_dest(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from dot_man import files
+
+    files.clear_comparison_cache()
+    monkeypatch.setattr(files, "_RACY_WINDOW_NS", 0)
+    src = tmp_path / "src_warm.txt"
+    dest = tmp_path / "dest_warm.txt"
+    src.write_text("Warm Content", encoding="utf-8")
+
+    saved, _ = smart_save_file(src, dest)
+    assert saved
+    # The first unchanged save reads dest once and records its digest
+    saved, _ = smart_save_file(src, dest)
+    assert not saved
+
+    with patch.object(files, "_content_matches_file") as compare:
+        saved, _ = smart_save_file(src, dest)
+    assert not saved
+    compare.assert_not_called()
+
+
+def test_smart_save_file_does_not_cache_racy_files(tmp_path):
+    from unittest.mock import patch
+
+    from dot_man import files
+
+    files.clear_comparison_cache()
+    src = tmp_path / "src_racy.txt"
+    dest = tmp_path / "dest_racy.txt"
+    src.write_text("Racy Content", encoding="utf-8")
+
+    smart_save_file(src, dest)
+    smart_save_file(src, dest)
+    assert files._metadata_cache == {}
+
+    # Just-modified files are always compared by content
+    with patch.object(
+        files, "_content_matches_file", wraps=files._content_matches_file
+    ) as compare:
+        saved, _ = smart_save_file(src, dest)
+    assert not saved
+    compare.assert_called_once()
+
+
 def test_smart_save_file_new_dest(tmp_path):
     src = tmp_path / "src_new.txt"
     dest = tmp_path / "dest_new.txt"
@@ -225,6 +225,18 @@ class TestMatchesPatterns:
 
         assert not matches_patterns(Path("file.txt"), [])
 
+    def test_compiled_patterns_match_fnmatch(self):
+        from fnmatch import fnmatch
+
+        from dot_man.files import _compile_patterns, _matches_compiled
+
+        patterns = ["*.log", "cache/*", "[!a]*.tmp", "exact.txt"]
+        compiled = _compile_patterns(patterns)
+        for rel in ["a.log", "cache/x", "b.tmp", "a.tmp", "dir/exact.txt", "x.txt"]:
+            path = Path(rel)
+            expected = any(fnmatch(path.name, p) or fnmatch(rel, p) for p in patterns)
+            assert _matches_compiled(path, compiled) is expected
+
 
 class TestCopyDirectory:
     def test_copy_directory_basic(self, tmp_path):
@@ -329,6 +341,26 @@ class TestCopyDirectory:
         assert copied == 1
         assert (dst / "link").read_text() == "target content"
 
+    def test_copy_directory_nested_prunes_and_skips_dir_links(self, tmp_path):
+        from dot_man.files import copy_directory
+
+        src = tmp_path / "src"
+        dst = tmp_path / "dst"
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "o.txt").write_text("outside")
+        (src / "a" / "b").mkdir(parents=True)
+        (src / "a" / "b" / "deep.txt").write_text("deep")
+        (src / "a" / "cache").mkdir()
+        (src / "a" / "cache" / "c.txt").write_text("cached")
+        (src / "linked").symlink_to(outside)
+
+        copied, failed, secrets = copy_directory(src, dst, exclude_patterns=["a/cache"])
+        assert (copied, failed) == (1, 0)
+        assert (dst / "a" / "b" / "deep.txt").read_text() == "deep"
+        assert not (dst / "a" / "cache").exists()
+        assert not (dst / "linked").exists()
+
 
 class TestCompareFiles:
     def test_compare_directories_identical(self, tmp_path):
@@ -418,6 +450,79 @@ class TestCompareFiles:
         f1.chmod(0o644)
         assert result is False
 
+    def test_compare_files_fast_path_same_mtime(self, tmp_path, monkeypatch):
+        import os
+
+        from dot_man import files
+        from dot_man.files import clear_comparison_cache, compare_files
+
+        clear_comparison_cache()
+        f1 = tmp_path / "f1.txt"
+        f2 = tmp_path / "f2.txt"
+        f1.write_text("aaaa")
+        f2.write_text("bbbb")
+        mtime_ns = f1.stat().st_mtime_ns
+        os.utime(f2, ns=(mtime_ns, mtime_ns))
+
+        monkeypatch.setattr(files, "_FAST_COMPARE", False)
+        assert compare_files(f1, f2) is False
+
+        clear_comparison_cache()
+        monkeypatch.setattr(files, "_FAST_COMPARE", True)
+        assert compare_files(f1, f2) is True
+
+    def test_compare_files_uses_digests_from_save(self, tmp_path, monkeypatch):
+        from dot_man import files
+        from dot_man.files import (
+            clear_comparison_cache,
+            compare_files,
+            smart_save_file,
+        )
+
+        clear_comparison_cache()
+        monkeypatch.setattr(files, "_RACY_WINDOW_NS", 0)
+        src = tmp_path / "src.txt"
+        dst = tmp_path / "dst.txt"
+        src.write_text("saved content")
+        assert smart_save_file(src, dst, check_secrets=False)[0] is True
+        # Verifying the unchanged copy records both digests
+        assert smart_save_file(src, dst, check_secrets=False)[0] is False
+
+        with patch("filecmp.cmp") as cmp:
+            assert compare_files(src, dst) is True
+        cmp.assert_not_called()
+
+        # A changed file no longer matches its cached entry
+        src.write_text("edited content!")
+        assert compare_files(src, dst) is False
+
+    def test_compare_files_ignores_entry_after_same_stat_rewrite(
+        self, tmp_path, monkeypatch
+    ):
+        import os
+        import time
+
+        from dot_man import files
+        from dot_man.files import clear_comparison_cache, compare_files
+
+        clear_comparison_cache()
+        monkeypatch.setattr(files, "_RACY_WINDOW_NS", 0)
+        f1 = tmp_path / "f1.txt"
+        f2 = tmp_path / "f2.txt"
+        f1.write_text("aaaa")
+        f2.write_text("aaaa")
+        files.smart_save_file(f1, f2, check_secrets=False)
+
+        assert files._metadata_cache
+
+        # Same size and mtime as cached, but the rewrite moves ctime
+        st = f2.stat()
+        time.sleep(0.05)  # step past the filesystem's timestamp tick
+        f2.write_text("bbbb")
+        os.utime(f2, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert f2.stat().st_ctime_ns != st.st_ctime_ns
+        assert compare_files(f1, f2) is False
+
 
 class TestGetFileStatus:
     def test_status_new(self, tmp_path):
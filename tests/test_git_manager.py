@@ -1,5 +1,7 @@
 """Tests for dot_man.core GitManager."""
 
+from unittest.mock import patch
+
 import pytest
 from git import Repo
 
@@ -41,6 +43,22 @@ class TestGitManagerInit:
         with pytest.raises(NotInitializedError):
             _ = gm.repo
 
+    def test_git_environment(self, git_repo, monkeypatch):
+        monkeypatch.setenv("LC_ALL", "de_DE.UTF-8")
+        env = git_repo._git_env()
+        assert env["LC_ALL"] == "C"
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        assert git_repo._git_env() is env
+        git_env = git_repo.repo.git.environment()
+        assert git_env["LC_ALL"] == "C"
+        assert git_env["GIT_OPTIONAL_LOCKS"] == "0"
+
+    def test_init_enables_untracked_cache(self, tmp_path):
+        gm = GitManager(tmp_path / "fresh")
+        gm.init()
+        with gm.repo.config_reader("repository") as config:
+            assert config.get_value("core", "untrackedCache") is True
+
     def test_is_initialized_true(self, git_repo):
         assert git_repo.is_initialized() is True
 
@@ -50,6 +68,17 @@ class TestGitManagerInit:
         gm = GitManager(empty)
         assert gm.is_initialized() is False
 
+    def test_is_initialized_single_stat(self, git_repo, monkeypatch):
+        import os
+
+        calls = []
+        real_stat = os.stat
+        monkeypatch.setattr(
+            "dot_man.core.os.stat", lambda p, *a, **k: calls.append(p) or real_stat(p)
+        )
+        assert git_repo.is_initialized() is True
+        assert calls == [git_repo._repo_path / ".git"]
+
     def test_init_creates_repo(self, tmp_path):
         repo_path = tmp_path / "new_repo"
         gm = GitManager(repo_path)
@@ -65,6 +94,20 @@ class TestGitManagerInit:
         assert reader.get_value("user", "name") == "dot-man"
 
 
+class TestLazyGitPython:
+    """GitPython is only imported once a method needs it."""
+
+    def test_import_does_not_load_gitpython(self):
+        import subprocess
+        import sys
+
+        code = "import sys, dot_man.core; print('git' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
 class TestBranches:
     """Tests for branch operations."""
 
@@ -94,6 +137,38 @@ class TestBranches:
         git_repo.checkout("new-branch", create=True)
         assert git_repo.current_branch() == "new-branch"
 
+    def test_checkout_create_existing_switches(self, git_repo):
+        original = git_repo.current_branch()
+        git_repo.create_branch("feature")
+        git_repo.checkout("feature", create=True)
+        assert git_repo.current_branch() == "feature"
+        git_repo.checkout(original, create=True)
+        assert git_repo.current_branch() == original
+
+    def test_checkout_create_invalid_name_raises(self, git_repo):
+        with pytest.raises(GitOperationError):
+            git_repo.checkout("bad..name", create=True)
+
+    def test_branch_queries_cached_until_mutation(self, git_repo, monkeypatch):
+        calls = []
+        real_git = git_repo._git
+        monkeypatch.setattr(
+            git_repo, "_git", lambda *a: calls.append(a[0]) or real_git(*a)
+        )
+
+        current = git_repo.current_branch()
+        assert git_repo.branch_exists(current)
+        assert not git_repo.branch_exists("feature")
+        git_repo.list_branches().append("mutating the copy is harmless")
+        assert git_repo.current_branch() == current
+        assert calls == ["symbolic-ref", "for-each-ref"]
+
+        git_repo.checkout("feature", create=True)
+        assert git_repo.branch_exists("feature")
+        assert git_repo.current_branch() == "feature"
+        git_repo.delete_branch(current, force=True)
+        assert not git_repo.branch_exists(current)
+
     def test_checkout_nonexistent_raises(self, git_repo):
         with pytest.raises(BranchNotFoundError):
             git_repo.checkout("doesnt-exist")
@@ -139,9 +214,34 @@ class TestCommits:
         assert sha is not None
         assert len(sha) == 40  # Full SHA
 
+    def test_commit_records_all_changes(self, git_repo):
+        root = git_repo._repo_path
+        (root / "init.txt").write_text("modified")
+        (root / "added.txt").write_text("new")
+        sha = git_repo.commit("Subject\n\nBody line")
+        head = Repo(root).head.commit
+        assert sha == head.hexsha
+        assert head.message == "Subject\n\nBody line\n"
+        assert sorted(head.stats.files) == ["added.txt", "init.txt"]
+        assert git_repo.is_dirty() is False
+
     def test_commit_nothing_returns_none(self, git_repo):
         assert git_repo.commit("Empty") is None
 
+    def test_commit_skips_status_scan(self, git_repo, monkeypatch):
+        monkeypatch.setattr(
+            git_repo, "status_porcelain", lambda *a, **k: pytest.fail("scanned")
+        )
+        assert git_repo.commit("Empty") is None
+        (git_repo._repo_path / "file.txt").write_text("content")
+        assert git_repo.commit("Add file") is not None
+
+    def test_commit_first_in_empty_repo(self, tmp_path):
+        gm = GitManager(tmp_path / "fresh")
+        gm.init()
+        assert gm.commit("Initial") is not None
+        assert gm.commit("Again") is None
+
     def test_add_all(self, git_repo):
         (git_repo._repo_path / "staged.txt").write_text("data")
         git_repo.add_all()
@@ -159,6 +259,22 @@ class TestCommits:
         status = git_repo.get_status()
         assert "init.txt" in status["modified"]
 
+    def test_get_status_buckets_in_one_call(self, git_repo):
+        root = git_repo._repo_path
+        (root / "staged.txt").write_text("data")
+        Repo(root).index.add(["staged.txt"])
+        (root / "init.txt").unlink()
+        (root / "newdir").mkdir()
+        (root / "newdir" / "a.txt").write_text("a")
+
+        status = git_repo.get_status()
+        assert status == {
+            "modified": [],
+            "new": ["staged.txt"],
+            "deleted": ["init.txt"],
+            "untracked": ["newdir/a.txt"],
+        }
+
     def test_get_commits(self, git_repo):
         commits = list(git_repo.get_commits(count=5))
         assert len(commits) >= 1
@@ -174,6 +290,57 @@ class TestCommits:
         commits = list(git_repo.get_commits(count=10))
         assert len(commits) >= 4  # 3 + initial
 
+    def test_get_commits_matches_gitpython(self, git_repo):
+        (git_repo._repo_path / "body.txt").write_text("body")
+        git_repo.commit("Subject line\nwrapped\n\nBody text")
+        (git_repo._repo_path / "more.txt").write_text("more")
+        git_repo.commit("Second")
+
+        commits = list(git_repo.get_commits(count=10))
+        expected = list(Repo(git_repo._repo_path).iter_commits(max_count=10))
+        assert [c["sha"] for c in commits] == [c.hexsha[:7] for c in expected]
+        assert commits[0]["message"] == "Second"
+        assert commits[1]["message"] == "Subject line"
+        assert commits[0]["author"] == "Tester"
+        assert commits[0]["date"] == expected[0].committed_datetime.isoformat()
+
+    def test_get_commits_small_reads(self, git_repo, monkeypatch):
+        for i in range(3):
+            (git_repo._repo_path / f"file{i}.txt").write_text(f"content{i}")
+            git_repo.commit(f"Commit {i}")
+        expected = list(git_repo.get_commits(count=10))
+
+        # Records split across many reads are reassembled intact
+        monkeypatch.setattr("dot_man.core._STREAM_CHUNK_SIZE", 5)
+        assert list(git_repo.get_commits(count=10)) == expected
+
+    def test_get_commits_stops_early(self, git_repo):
+        for i in range(3):
+            (git_repo._repo_path / f"file{i}.txt").write_text(f"content{i}")
+            git_repo.commit(f"Commit {i}")
+        commits = git_repo.get_commits(count=10)
+        assert next(commits)["message"] == "Commit 2"
+        commits.close()
+
+    def test_get_commits_not_a_repo(self, tmp_path):
+        with pytest.raises(NotInitializedError):
+            list(GitManager(tmp_path).get_commits())
+
+    def test_get_commits_empty_repo(self, tmp_path):
+        Repo.init(tmp_path)
+        assert list(GitManager(tmp_path).get_commits()) == []
+
+    def test_current_branch_detached(self, git_repo):
+        repo = Repo(git_repo._repo_path)
+        repo.head.reference = repo.head.commit
+        assert git_repo.current_branch() == "HEAD"
+
+    def test_queries_do_not_use_parent_repo(self, git_repo):
+        nested = git_repo._repo_path / "nested"
+        nested.mkdir()
+        with pytest.raises(NotInitializedError):
+            GitManager(nested).current_branch()
+
 
 class TestRemote:
     """Tests for remote operations."""
@@ -206,6 +373,152 @@ class TestRemote:
         with pytest.raises(GitOperationError, match="No remote"):
             git_repo.pull()
 
+    def test_remote_branch_exists(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+        git_repo.fetch()
+
+        assert git_repo._remote_branch_exists(git_repo.current_branch()) is True
+        assert git_repo._remote_branch_exists("no-such-branch") is False
+
+    def test_fetch_rate_limited_unless_forced(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        with patch.object(git_repo, "_git", wraps=git_repo._git) as git:
+            git_repo.fetch()
+            git_repo.fetch()
+            assert git.call_count == 1
+            git_repo.fetch(force=True)
+            assert git.call_count == 2
+            assert git.call_args.args[0] == "fetch"
+
+    def test_get_sync_status_reused_until_change(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+
+        first = git_repo.get_sync_status()
+        with patch.object(git_repo, "_git", wraps=git_repo._git) as git:
+            assert git_repo.get_sync_status() == first
+            git.assert_not_called()
+
+            (git_repo._repo_path / "new.txt").write_text("new")
+            git_repo.commit("Local change")
+            assert git_repo.get_sync_status()["ahead"] == 1
+
+    def test_get_sync_status_fetches_in_background(self, git_repo, tmp_path):
+        import threading
+
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+
+        fetch_threads = []
+        run_git = git_repo._git
+
+        def record_fetch(*args):
+            if args[0] == "fetch":
+                fetch_threads.append(threading.get_ident())
+            return run_git(*args)
+
+        with patch.object(git_repo, "_git", side_effect=record_fetch):
+            status = git_repo.get_sync_status(force_refresh=True)
+        assert fetch_threads and fetch_threads[0] != threading.get_ident()
+        assert status["remote_branch_exists"] is True
+
+    def test_get_sync_status_fetch_error_propagates(self, git_repo, tmp_path):
+        git_repo.set_remote(str(tmp_path / "missing.git"))
+        with pytest.raises(GitOperationError, match="Failed to fetch"):
+            git_repo.get_sync_status()
+
+    def test_pull_restores_changes_and_keeps_user_stashes(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+        clone = Repo.clone_from(str(remote), tmp_path / "clone")
+        with clone.config_writer() as config:
+            config.set_value("user", "name", "Tester")
+            config.set_value("user", "email", "test@test.com")
+        (tmp_path / "clone" / "remote.txt").write_text("remote")
+        clone.index.add(["remote.txt"])
+        clone.index.commit("Remote commit")
+        clone.remotes.origin.push()
+
+        root = git_repo._repo_path
+        repo = Repo(root)
+        (root / "init.txt").write_text("user stash")
+        repo.git.stash("push", "-m", "mine")
+        (root / "init.txt").write_text("uncommitted")
+
+        git_repo.pull()
+        assert (root / "remote.txt").read_text() == "remote"
+        assert (root / "init.txt").read_text() == "uncommitted"
+        assert repo.git.stash("list").splitlines() == [
+            f"stash@{{0}}: On {git_repo.current_branch()}: mine"
+        ]
+
+    def test_pull_after_fetch_skips_when_up_to_date(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+        git_repo.fetch()
+        (git_repo._repo_path / "init.txt").write_text("uncommitted")
+
+        with patch("git.cmd.Git._call_process") as call:
+            assert git_repo.pull() == "Already up to date."
+            call.assert_not_called()
+        assert (git_repo._repo_path / "init.txt").read_text() == "uncommitted"
+
+    def test_pull_stores_changes_that_do_not_apply(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+        clone = Repo.clone_from(str(remote), tmp_path / "clone")
+        with clone.config_writer() as config:
+            config.set_value("user", "name", "Tester")
+            config.set_value("user", "email", "test@test.com")
+        (tmp_path / "clone" / "init.txt").write_text("remote edit")
+        clone.index.add(["init.txt"])
+        clone.index.commit("Remote edit")
+        clone.remotes.origin.push()
+
+        (git_repo._repo_path / "init.txt").write_text("local edit")
+        message = git_repo.pull()
+        assert "Stash pop failed" in message
+        stashes = Repo(git_repo._repo_path).git.stash("list")
+        assert "dot-man-auto-stash" in stashes
+
+    def test_get_sync_status_ahead_behind(self, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        Repo.init(remote, bare=True)
+        git_repo.set_remote(str(remote))
+        git_repo.push()
+        # One commit only on the remote, two only local
+        clone = Repo.clone_from(str(remote), tmp_path / "clone")
+        with clone.config_writer() as config:
+            config.set_value("user", "name", "Tester")
+            config.set_value("user", "email", "test@test.com")
+        (tmp_path / "clone" / "remote.txt").write_text("remote")
+        clone.index.add(["remote.txt"])
+        clone.index.commit("Remote commit")
+        clone.remotes.origin.push()
+        for name in ("a.txt", "b.txt"):
+            (git_repo._repo_path / name).write_text(name)
+            git_repo.commit(f"Add {name}")
+
+        status = git_repo.get_sync_status()
+        assert status["ahead"] == 2
+        assert status["behind"] == 1
+        assert status["remote_branch_exists"] is True
+
 
 class TestBranchStats:
     """Tests for branch stats and file reading."""
@@ -217,6 +530,20 @@ class TestBranchStats:
         assert stats["file_count"] >= 1
         assert stats["last_commit_date"] != "N/A"
 
+    def test_get_branch_stats_counts(self, git_repo):
+        (git_repo._repo_path / "sub").mkdir()
+        (git_repo._repo_path / "sub" / "nested.txt").write_text("x")
+        git_repo.commit("Second commit\n\nWith a body")
+        current = git_repo.current_branch()
+        stats = git_repo.get_branch_stats(current)
+        head = Repo(git_repo._repo_path).head.commit
+        assert stats["commit_count"] == 2
+        assert stats["file_count"] == 2
+        assert stats["last_commit_msg"] == "Second commit"
+        assert stats["last_commit_date"] == head.committed_datetime.strftime(
+            "%Y-%m-%d %H:%M"
+        )
+
     def test_get_branch_stats_nonexistent(self, git_repo):
         stats = git_repo.get_branch_stats("no-such-branch")
         assert stats["commit_count"] == 0
@@ -243,6 +570,20 @@ class TestBranchStats:
         content = git_repo.get_file_from_branch(current, "no-file.txt")
         assert content is None
 
+    def test_get_file_from_branch_batch_reads(self, git_repo):
+        root = git_repo._repo_path
+        (root / "dir").mkdir()
+        (root / "dir" / "a.txt").write_text("line\n")
+        git_repo.commit("add dir")
+        current = git_repo.current_branch()
+
+        # Misses and non-blobs leave the shared cat-file process usable
+        assert git_repo.get_file_from_branch(current, "missing.txt") is None
+        assert git_repo.get_file_from_branch(current, "dir") is None
+        assert git_repo.get_file_from_branch("no-such-branch", "init.txt") is None
+        assert git_repo.get_file_from_branch(current, "dir/a.txt") == "line\n"
+        assert git_repo.get_file_from_branch(current, "init.txt") == "initial"
+
     def test_get_file_from_different_branch(self, git_repo):
         original = git_repo.current_branch()
         git_repo.checkout("other", create=True)
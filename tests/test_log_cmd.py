@@ -251,6 +251,34 @@ class TestLogInteractive:
             MockApp.assert_called_once()
             instance.run.assert_called_once()
 
+    def test_viewer_reuses_rendered_diffs(self):
+        """Revisiting a commit in the viewer does not rerun git show."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from dot_man.tui_log import LogViewerApp
+
+        ops = MagicMock()
+        ops.git.get_commits.return_value = [
+            {"sha": "a" * 40, "message": "first"},
+            {"sha": "b" * 40, "message": "second"},
+        ]
+        ops.git.repo.git.show.return_value = "diff"
+
+        async def run_viewer():
+            app = LogViewerApp()
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                for sha in ("b" * 40, "a" * 40, "b" * 40):
+                    app._show_commit_diff(sha)
+                return len(app.query("CommitItem"))
+
+        with patch("dot_man.tui_log.get_operations", return_value=ops):
+            item_count = asyncio.run(run_viewer())
+
+        assert item_count == 2
+        assert ops.git.repo.git.show.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Log — File argument
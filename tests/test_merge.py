@@ -172,6 +172,11 @@ class TestHooks:
         hook = get_hook_for_config("quickshell")
         assert hook is None
 
+    def test_get_hook_for_config_first_match_wins(self):
+        """Test earlier entries win when several names match."""
+        assert get_hook_for_config("NVIM") == get_hook_for_config("nvim")
+        assert get_hook_for_config("nvim") != get_hook_for_config("vim")
+
     def test_get_hook_for_config_unknown(self):
         """Test unknown config returns None."""
         hook = get_hook_for_config("unknown_config_xyz")
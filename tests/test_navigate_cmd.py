@@ -126,6 +126,69 @@ class TestNavigateBranchSwitch:
         assert result.exit_code == 0
         assert "Created" in result.output or "Switched" in result.output
 
+    def test_navigate_save_skips_commit_on_clean_tree(self, navigate_integration):
+        """Test --save reports no changes and skips the commit when nothing changed."""
+        from dot_man.core import GitManager
+
+        with patch.object(GitManager, "commit") as mock_commit:
+            result = navigate_integration.invoke(
+                cli, ["navigate", "clean-branch", "--save", "--force"]
+            )
+        assert result.exit_code == 0, result.output
+        assert "No changes to save" in result.output
+        mock_commit.assert_not_called()
+
+    def test_navigate_scans_once_under_the_lock(self, navigate_integration):
+        """Test one scan feeds hooks and deploy, all while the lock is held."""
+        from dot_man.operations import DotManOperations
+
+        calls = []
+        scan = DotManOperations.scan_deployable_changes
+
+        def record_scan(self, sections):
+            calls.append("scan")
+            return scan(self, sections)
+
+        class RecordingLock:
+            def __init__(self, path):
+                pass
+
+            def __enter__(self):
+                calls.append("lock")
+
+            def __exit__(self, *exc):
+                calls.append("unlock")
+
+        with (
+            patch("dot_man.cli.navigate_cmd.FileLock", RecordingLock),
+            patch(
+                "dot_man.cli.navigate_cmd._run_shell_hooks",
+                side_effect=lambda hooks, label: calls.append(label),
+            ),
+            patch.object(DotManOperations, "scan_deployable_changes", record_scan),
+            patch.object(
+                DotManOperations,
+                "execute_deployment_plan",
+                side_effect=lambda plan: calls.append("deploy")
+                or {"deployed": 0, "errors": []},
+            ),
+            patch.object(DotManOperations, "deploy_all") as deploy_all,
+        ):
+            result = navigate_integration.invoke(
+                cli, ["navigate", "hook-order", "--no-save", "--force"]
+            )
+        assert result.exit_code == 0, result.output
+        deploy_all.assert_not_called()
+        start = calls.index("lock")
+        assert calls[start : start + 5] == [
+            "lock",
+            "scan",
+            "Running pre-deploy hooks",
+            "deploy",
+            "unlock",
+        ]
+        assert calls.count("scan") == 1
+
 
 class TestNavigateCommit:
     """Test navigating to commits."""
@@ -822,13 +822,13 @@ class TestRemoteSetUnit:
     """Focused unit tests for `remote set` with error simulation."""
 
     @patch("dot_man.cli.remote_cmd.GitManager")
-    @patch("dot_man.cli.remote_cmd.GlobalConfig")
+    @patch("dot_man.operations.get_operations")
     def test_persists_remote_url_in_global_config(
-        self, mock_gc_cls, mock_git_cls, integration_runner
+        self, mock_get_ops, mock_git_cls, integration_runner
     ):
         """After GitManager.set_remote, remote URL must be saved in GlobalConfig."""
         mock_gc_instance = MagicMock()
-        mock_gc_cls.return_value = mock_gc_instance
+        mock_get_ops.return_value.global_config = mock_gc_instance
 
         integration_runner.invoke(
             cli, ["remote", "set", "https://example.com/repo.git"]
@@ -836,6 +836,7 @@ class TestRemoteSetUnit:
 
         assert mock_gc_instance.remote_url == "https://example.com/repo.git"
         mock_gc_instance.save.assert_called_once()
+        mock_gc_instance.load.assert_not_called()
 
     @patch("dot_man.cli.remote_cmd.GitManager")
     def test_updates_existing_origin(self, mock_git_cls, integration_runner):
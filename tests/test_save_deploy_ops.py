@@ -26,6 +26,9 @@ class FakeOps(SaveDeployMixin):
     def get_section(self, name):
         return self._sections[name]
 
+    def get_all_sections(self):
+        return list(self._sections.values())
+
     def get_sections(self):
         return list(self._sections.keys())
 
@@ -167,6 +170,7 @@ class TestSaveSection:
             saved, secrets, errors, symlinks = ops.save_section(section)
             assert saved == 1
             assert vault.stash_secret.called
+            assert vault.stash_secret.call_args.kwargs["branch"] == "main"
 
     def test_save_section_nonexistent_path(self, tmp_path):
         """Non-existent paths should be silently skipped."""
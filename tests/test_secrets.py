@@ -93,3 +93,23 @@ def test_multiple_secrets_callback():
     assert "***REDACTED***" in redacted  # First one redacted
     assert "abcdef" in redacted  # Second one visible
     assert count == 1
+
+
+def test_scan_directory_walk(tmp_path):
+    """Test scan_directory recursion, .git pruning, excludes, and symlinked dirs."""
+    secret = "password = 'secret_pass'\n"
+    (tmp_path / "nested" / "deep").mkdir(parents=True)
+    (tmp_path / "nested" / "deep" / "conf").write_text(secret)
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text(secret)
+    (tmp_path / "skip.log").write_text(secret)
+
+    outside = tmp_path.parent / f"{tmp_path.name}_outside"
+    outside.mkdir()
+    (outside / "conf").write_text(secret)
+    (tmp_path / "linked").symlink_to(outside, target_is_directory=True)
+
+    scanner = SecretScanner()
+    matches = list(scanner.scan_directory(tmp_path, exclude_patterns=["*.log"]))
+
+    assert [m.file for m in matches] == [tmp_path / "nested" / "deep" / "conf"]
@@ -259,6 +259,19 @@ class TestResolveHook:
             result = section._resolve_hook("echo {branch}")
             assert result == "echo work"
 
+    def test_branch_lookup_only_when_placeholder_used(self):
+        """Other placeholders should not trigger the git branch lookup."""
+        from dot_man.section import Section
+
+        with patch("dot_man.section.Section._get_current_branch") as mock_branch:
+            section = Section(
+                name="ii",
+                paths=["/nonexistent/quickshell/ii"],
+                post_deploy="qs -c {config_name} -p {config_root}",
+            )
+        mock_branch.assert_not_called()
+        assert section.post_deploy == "qs -c ii -p /nonexistent/quickshell"
+
     def test_resolve_alias(self):
         """Hook aliases should be resolved to their command."""
         from dot_man.section import Section
@@ -351,6 +364,25 @@ class TestSectionMethods:
         )
         assert str(result) == "/home/user/.dot-man/repo/bash/bashrc"
 
+    def test_get_repo_path_tracks_changes(self):
+        """Test the memoized prefix follows repo_dir and repo_base changes."""
+        from dot_man.section import Section
+
+        section = Section(name="nvim", paths=["~/.config/nvim"], repo_base="nvim")
+        local = Path("/home/user/.config/nvim/init.lua")
+        repo_a = Path("/repo-a")
+
+        assert section.get_repo_path(local, repo_a) == Path("/repo-a/nvim/init.lua")
+        assert section.get_repo_path(local, Path("/repo-b")) == Path(
+            "/repo-b/nvim/init.lua"
+        )
+
+        section.repo_base = "editor"
+        assert section.get_repo_path(local, repo_a) == Path("/repo-a/editor/init.lua")
+
+        section.repo_path = "single/file"
+        assert section.get_repo_path(local, repo_a) == Path("/repo-a/single/file")
+
 
 class TestToDict:
     """Test to_dict method."""
@@ -365,6 +397,42 @@ class TestToDict:
         assert "paths" in result
         assert "secrets_filter" not in result  # Default
 
+    def test_to_dict_reuses_generated_repo_base(self):
+        """to_dict reuses the auto repo_base until the first path changes."""
+        from unittest.mock import patch
+
+        from dot_man.section import Section
+
+        section = Section(name="test", paths=["~/.bashrc"])
+        with patch.object(
+            Section, "_generate_repo_base", autospec=True, return_value="bashrc"
+        ) as mock_generate:
+            assert "repo_base" not in section.to_dict()
+            assert "repo_base" not in section.to_dict()
+            mock_generate.assert_not_called()
+
+            section.paths = [Path("~/.zshrc")]
+            mock_generate.return_value = "zshrc"
+            assert section.to_dict()["repo_base"] == "bashrc"
+            mock_generate.assert_called_once()
+
+    def test_slots_reject_unknown_attributes(self):
+        """Section uses slots, so typos raise and copies keep every field."""
+        import copy
+
+        import pytest
+
+        from dot_man.section import Section
+
+        section = Section(name="test", paths=["~/.bashrc"], exclude=["*.log"])
+        assert not hasattr(section, "__dict__")
+        with pytest.raises(AttributeError):
+            section.excludes = ["*.tmp"]  # type: ignore[attr-defined]
+
+        clone = copy.copy(section)
+        assert clone.to_dict() == section.to_dict()
+        assert clone.repo_base == "bashrc"
+
     def test_to_dict_with_repo_path(self):
         """to_dict should include repo_path when explicitly set."""
         from dot_man.section import Section
@@ -44,7 +44,7 @@ def mock_ops():
         {"section": "config", "local_path": config_path, "status": "MODIFIED"},
     ]
 
-    ops.git.is_dirty.return_value = False
+    ops.git.status_porcelain.return_value = []
     return ops
 
 
@@ -72,6 +72,45 @@ class TestStatusHappyPath:
         assert result.exit_code == 0
 
 
+class TestStatusJsonOutput:
+    """Test --json output is machine-readable."""
+
+    def test_json_output_is_only_json(self, runner, mock_ops):
+        import json
+
+        with patch("dot_man.operations.get_operations", return_value=mock_ops):
+            result = runner.invoke(cli, ["status", "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["branch"] == "main"
+        assert [s["name"] for s in data["sections"]] == ["shell", "config"]
+        assert data["summary"]["modified"] == 1
+
+
+class TestStatusDisplayPath:
+    """Test path shortening in the file table."""
+
+    def test_home_prefix_replaced_with_tilde(self, runner, mock_ops, tmp_path):
+        home = tmp_path / "home"
+        inside = MagicMock()
+        inside.__str__ = lambda self: str(home / ".bashrc")
+        sibling = MagicMock()
+        sibling.__str__ = lambda self: str(tmp_path / "home2" / "x")
+        mock_ops.get_detailed_status.return_value = [
+            {"section": "shell", "local_path": inside, "status": "IDENTICAL"},
+            {"section": "shell", "local_path": sibling, "status": "IDENTICAL"},
+        ]
+
+        with (
+            patch("dot_man.operations.get_operations", return_value=mock_ops),
+            patch("dot_man.cli.status_cmd.Path.home", return_value=home),
+        ):
+            result = runner.invoke(cli, ["status"], terminal_width=200)
+        assert result.exit_code == 0
+        assert "~/.bashrc" in result.output
+        assert "~2" not in result.output
+
+
 class TestStatusNoSections:
     """Test when no sections are tracked."""
 
@@ -180,21 +219,52 @@ class TestStatusTruncation:
             result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
 
+    def test_summary_counts_truncated_items(self, runner, mock_ops):
+        sections = {}
+        for i in range(12):
+            s = MagicMock()
+            s.inherits = []
+            sections[f"section{i}"] = s
+        mock_ops.get_sections.return_value = list(sections.keys())
+        mock_ops.get_section.side_effect = lambda name: sections[name]
+
+        status_items = [
+            {
+                "section": f"section{i}",
+                "local_path": MagicMock(),
+                "status": "MODIFIED" if j == 0 else "IDENTICAL",
+            }
+            for i in range(12)
+            for j in range(6)
+        ]
+        mock_ops.get_detailed_status.return_value = iter(status_items)
+
+        with patch("dot_man.operations.get_operations", return_value=mock_ops):
+            result = runner.invoke(cli, ["status"])
+        assert result.exit_code == 0
+        assert result.output.count("+2 more sections") == 1
+        assert result.output.count("more files") == 10
+        assert "12 modified" in result.output
+        assert "60 identical" in result.output
+
 
 class TestStatusDirtyRepo:
     """Test dirty repo warning."""
 
     def test_dirty_repo_returns_zero(self, runner, mock_ops):
-        mock_ops.git.is_dirty.return_value = True
+        mock_ops.git.status_porcelain.return_value = [(" M", "bashrc/.bashrc")]
         with patch("dot_man.operations.get_operations", return_value=mock_ops):
             result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
+        assert "1 uncommitted changes" in result.output
+        mock_ops.git.status_porcelain.assert_called_once()
 
     def test_clean_repo_returns_zero(self, runner, mock_ops):
-        mock_ops.git.is_dirty.return_value = False
+        mock_ops.git.status_porcelain.return_value = []
         with patch("dot_man.operations.get_operations", return_value=mock_ops):
             result = runner.invoke(cli, ["status"])
         assert result.exit_code == 0
+        assert "uncommitted" not in result.output
 
 
 class TestStatusRemoteNotConfigured: